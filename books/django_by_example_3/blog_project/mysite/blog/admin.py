@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Post, Comment
+from .models import Post, Comment, QueuedEmail
 
 # Register your models here.
 @admin.register(Post)
@@ -20,3 +20,9 @@ class CommentAdmin(admin.ModelAdmin):
     list_filter = ("active", "created", "updated")
     search_fields = ("name", "email", "body")
 
+
+@admin.register(QueuedEmail)
+class QueuedEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "to", "status", "created", "sent")
+    list_filter = ("status", "created")
+    search_fields = ("subject", "to")
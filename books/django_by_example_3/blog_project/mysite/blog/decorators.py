@@ -0,0 +1,72 @@
+import hashlib
+from functools import wraps
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.views.decorators.http import condition
+
+from .models import Post
+
+POSTS_STATE_CACHE_KEY = "blog_posts_state"
+POSTS_STATE_CACHE_TIMEOUT = 60
+RENDERED_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_posts_state():
+    """
+    When a published post last changed and how many there are. Unpublishing
+    or deleting a post changes the count even when the date stays the same.
+    """
+    state = cache.get(POSTS_STATE_CACHE_KEY)
+    if state is None:
+        state = Post.published.aggregate(updated=Max("updated"), total=Count("id"))
+        cache.set(POSTS_STATE_CACHE_KEY, state, POSTS_STATE_CACHE_TIMEOUT)
+
+    return state
+
+
+def clear_posts_state_cache():
+    cache.delete(POSTS_STATE_CACHE_KEY)
+
+
+def get_last_modified(request=None, *args, **kwargs):
+    return get_posts_state()["updated"]
+
+
+def get_etag(request=None, *args, **kwargs):
+    state = get_posts_state()
+    updated = state["updated"].timestamp() if state["updated"] else 0
+    return f"{updated}-{state['total']}"
+
+
+def cache_until_posts_change(fx):
+    """
+    Answer 304 to conditional requests and otherwise serve the response
+    rendered the last time posts changed, so the view only runs after an
+    edit.
+    """
+
+    @wraps(fx)
+    def wrapper(request, *args, **kwargs):
+        url = f"{request.get_host()}{request.get_full_path()}"
+        key = "blog_rendered_" + hashlib.sha1(url.encode()).hexdigest()
+        key = f"{key}_{get_etag()}"
+
+        rendered = cache.get(key)
+        if rendered is None:
+            response = fx(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            if hasattr(response, "render"):
+                response.render()
+            rendered = (response.content, response.status_code, list(response.items()))
+            cache.set(key, rendered, RENDERED_CACHE_TIMEOUT)
+
+        content, status, headers = rendered
+        response = HttpResponse(content, status=status)
+        for header, value in headers:
+            response[header] = value
+        return response
+
+    return condition(etag_func=get_etag, last_modified_func=get_last_modified)(wrapper)
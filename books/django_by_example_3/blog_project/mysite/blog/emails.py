@@ -0,0 +1,73 @@
+import logging
+import socket
+from smtplib import SMTPConnectError, SMTPServerDisconnected
+
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import QueuedEmail
+
+logger = logging.getLogger(__name__)
+
+# The mail server went away, not a problem with the e-mail itself
+CONNECTION_ERRORS = (
+    SMTPConnectError,
+    SMTPServerDisconnected,
+    ConnectionError,
+    socket.timeout,
+)
+
+
+def send_queued_emails(batch_size=100):
+    """
+    Deliver pending e-mails over a single connection, recording the status
+    of each one. Returns how many were sent.
+
+    Rows are locked while they are sent, so several workers never send the
+    same e-mail. If the connection fails, the e-mails not sent yet are left
+    pending for the next run.
+    """
+    with transaction.atomic():
+        emails = list(
+            QueuedEmail.objects.select_for_update(skip_locked=True).filter(
+                status="pending"
+            )[:batch_size]
+        )
+        if not emails:
+            return 0
+
+        connection = get_connection()
+        try:
+            connection.open()
+        except OSError:
+            logger.exception("Could not connect to the mail server")
+            return 0
+
+        sent = 0
+        try:
+            for email in emails:
+                message = EmailMessage(
+                    email.subject,
+                    email.body,
+                    email.from_email,
+                    [email.to],
+                    connection=connection,
+                )
+                try:
+                    message.send()
+                except CONNECTION_ERRORS:
+                    logger.exception("Lost the connection to the mail server")
+                    break
+                except Exception as e:
+                    email.status = "failed"
+                    email.error = str(e)
+                else:
+                    email.status = "sent"
+                    email.sent = timezone.now()
+                    sent += 1
+                email.save(update_fields=["status", "error", "sent"])
+        finally:
+            connection.close()
+
+    return sent
@@ -1,6 +1,5 @@
 from django import forms
-from django.core.mail import send_mail
-from .models import Post, Comment
+from .models import Post, Comment, QueuedEmail
 
 
 class PostShareForm(forms.Form):
@@ -16,7 +15,9 @@ class PostShareForm(forms.Form):
         cd = self.cleaned_data
         post = cd["post"]
 
-        send_mail(post.title, post.body, cd["email"], [cd["to"]])
+        QueuedEmail.objects.create(
+            subject=post.title, body=post.body, from_email=cd["email"], to=cd["to"]
+        )
 
 class CommentForm(forms.ModelForm):
     class Meta:
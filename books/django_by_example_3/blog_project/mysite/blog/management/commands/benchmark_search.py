@@ -0,0 +1,83 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory
+
+from blog.models import Post
+from blog.views import PostListView
+
+SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "zen", "bar")
+
+
+def make_words(rng, count):
+    return ["".join(rng.choice(SYLLABLES) for _ in range(3)) for _ in range(count)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the ranked search and the trigram fallback of the post list "
+        "against generated posts, which are rolled back afterwards"
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--sizes", dest="sizes", type=int, nargs="+", default=[10000, 100000]
+        )
+        parser.add_argument("--repeat", dest="repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        for size in options["sizes"]:
+            with transaction.atomic():
+                word = self.create_posts(size)
+                ranked = self.time_search(word, options["repeat"])
+                # Misspelled, so the full-text search finds nothing
+                fallback = self.time_search(word[:-1], options["repeat"])
+                transaction.set_rollback(True)
+
+            self.stdout.write(
+                f"{size} posts: ranked search {ranked:.1f} ms, "
+                f"trigram fallback {fallback:.1f} ms (median)"
+            )
+
+    def create_posts(self, size):
+        rng = random.Random(size)
+        words = make_words(rng, 1000)
+        author, _ = User.objects.get_or_create(username="benchmark")
+
+        Post.objects.bulk_create(
+            (
+                Post(
+                    title=" ".join(rng.sample(words, 3)),
+                    slug=f"benchmark-{i}",
+                    author=author,
+                    body=" ".join(rng.choices(words, k=100)),
+                    status="published",
+                )
+                for i in range(size)
+            ),
+            batch_size=1000,
+        )
+        Post.objects.filter(author=author).update(search_vector=Post.SEARCH_VECTOR)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE blog_post")
+
+        return rng.choice(words)
+
+    def time_search(self, search, repeat):
+        """
+        Median time of the list view query, paginated as the page is.
+        """
+        view = PostListView.as_view()
+        request = RequestFactory().get("/blog/", {"search": search})
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            list(view(request).context_data["posts"])
+            timings.append((time.perf_counter() - start) * 1000)
+
+        return statistics.median(timings)
@@ -0,0 +1,93 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from taggit.models import Tag, TaggedItem
+
+from blog.models import Post
+from blog.similar import get_similar_posts, refresh_similar_posts
+
+
+def tag_overlap(post, count=4):
+    """
+    Posts sharing the most tags, aggregated on every request
+    """
+    return list(
+        Post.published.filter(tags__in=post.tags.all())
+        .exclude(id=post.id)
+        .annotate(same_tags=Count("tags"))
+        .order_by("-same_tags", "-publish")[:count]
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the similar posts lookup against the aggregation it replaces, "
+        "as posts get more tags. Generated posts are rolled back afterwards"
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--posts", dest="posts", type=int, default=500)
+        parser.add_argument(
+            "--tags", dest="tags", type=int, nargs="+", default=[1, 10, 50]
+        )
+        parser.add_argument("--repeat", dest="repeat", type=int, default=50)
+
+    def handle(self, *args, **options):
+        for tags in options["tags"]:
+            with transaction.atomic():
+                posts = self.create_posts(options["posts"], tags)
+                table = self.time_lookup(get_similar_posts, posts, options["repeat"])
+                aggregation = self.time_lookup(tag_overlap, posts, options["repeat"])
+                transaction.set_rollback(True)
+
+            self.stdout.write(
+                f"{tags} tags per post: overlap table {table:.2f} ms, "
+                f"aggregation {aggregation:.2f} ms (median)"
+            )
+
+    def create_posts(self, count, tags):
+        rng = random.Random(tags)
+        author, _ = User.objects.get_or_create(username="benchmark")
+        posts = Post.objects.bulk_create(
+            Post(
+                title=f"Post {i}",
+                slug=f"benchmark-{i}",
+                author=author,
+                body="...",
+                status="published",
+            )
+            for i in range(count)
+        )
+
+        # Enough tags that posts share a few of them whatever their number
+        pool = Tag.objects.bulk_create(
+            Tag(name=f"benchmark {i}", slug=f"benchmark-{i}") for i in range(tags * 20)
+        )
+        content_type = ContentType.objects.get_for_model(Post)
+        TaggedItem.objects.bulk_create(
+            TaggedItem(tag=tag, content_type=content_type, object_id=post.id)
+            for post in posts
+            for tag in rng.sample(pool, tags)
+        )
+
+        for post in posts:
+            refresh_similar_posts(post)
+
+        return posts
+
+    def time_lookup(self, lookup, posts, repeat):
+        rng = random.Random(0)
+        timings = []
+        for _ in range(repeat):
+            post = rng.choice(posts)
+            start = time.perf_counter()
+            lookup(post)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        return statistics.median(timings)
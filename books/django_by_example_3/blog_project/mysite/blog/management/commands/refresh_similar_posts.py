@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post, SimilarPost
+from blog.similar import refresh_similar_posts
+
+
+class Command(BaseCommand):
+    help = "Rebuild the tag overlap table used for similar posts"
+
+    def handle(self, *args, **options):
+        SimilarPost.objects.all().delete()
+        total = 0
+        for post in Post.published.iterator():
+            refresh_similar_posts(post)
+            total += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {total} posts"))
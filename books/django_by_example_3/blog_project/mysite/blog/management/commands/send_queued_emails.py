@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog.emails import send_queued_emails
+
+
+class Command(BaseCommand):
+    help = "Deliver the e-mails queued by the post share form"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--batch-size", dest="batch_size", type=int, default=100)
+        parser.add_argument(
+            "--interval",
+            dest="interval",
+            type=int,
+            help="Keep running, polling the queue every given seconds",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent = send_queued_emails(options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"Sent {sent} e-mails"))
+
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored full-text search vector of every post"
+
+    def handle(self, *args, **options):
+        total = Post.objects.update(search_vector=Post.SEARCH_VECTOR)
+        self.stdout.write(self.style.SUCCESS(f"Updated {total} posts"))
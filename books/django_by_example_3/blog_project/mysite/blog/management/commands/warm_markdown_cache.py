@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = "Render the Markdown body of every published post into the cache"
+
+    def handle(self, *args, **options):
+        total = 0
+        for post in Post.published.only("id", "body", "updated").iterator():
+            post.get_body_html()
+            total += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Rendered {total} posts"))
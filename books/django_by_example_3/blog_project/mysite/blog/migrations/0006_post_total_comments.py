@@ -0,0 +1,29 @@
+# Generated by Django 3.0.8 on 2026-10-18 12:30
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def count_comments(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+    totals = Comment.objects.filter(post=models.OuterRef('pk')).values('post').annotate(
+        total=models.Count('pk')
+    ).values('total')
+    Post.objects.update(total_comments=Coalesce(models.Subquery(totals), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_post_title_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='total_comments',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(count_comments, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.0.8 on 2026-10-18 12:50
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def count_active_comments(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+    totals = Comment.objects.filter(post=models.OuterRef('pk'), active=True).values('post').annotate(
+        total=models.Count('pk')
+    ).values('total')
+    Post.objects.update(active_comment_count=Coalesce(models.Subquery(totals), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_post_total_comments'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='active_comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'created', 'id'], name='blog_comment_keyset'),
+        ),
+        migrations.RunPython(count_active_comments, migrations.RunPython.noop),
+    ]
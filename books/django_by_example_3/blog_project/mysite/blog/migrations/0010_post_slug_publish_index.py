@@ -0,0 +1,17 @@
+# Generated by Django 3.0.8 on 2026-10-18 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_similarpost'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(status='published'), fields=['slug', 'publish'], name='blog_post_slug_publish'),
+        ),
+    ]
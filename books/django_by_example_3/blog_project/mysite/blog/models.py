@@ -1,4 +1,8 @@
+import mistune
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.core.cache import cache
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
@@ -27,15 +31,53 @@ class Post(models.Model):
     created = models.DateTimeField(auto_now_add=True)
     updated = models.DateTimeField(auto_now=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="draft")
+    search_vector = SearchVectorField(null=True, editable=False)
+    total_comments = models.PositiveIntegerField(default=0, db_index=True, editable=False)
+    active_comment_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ("-publish",)
+        indexes = (
+            GinIndex(fields=["search_vector"], name="blog_post_search_vector_gin"),
+            GinIndex(
+                fields=["title"], name="blog_post_title_trgm", opclasses=["gin_trgm_ops"]
+            ),
+            models.Index(
+                fields=["slug", "publish"],
+                name="blog_post_slug_publish",
+                condition=models.Q(status="published"),
+            ),
+        )
 
     objects = models.Manager()
     published = PostPublishedManager()
 
     tags = TaggableManager()
 
+    SEARCH_VECTOR = SearchVector("title", weight="A") + SearchVector("body", weight="B")
+
+    def save(self, *args, **kwargs):
+        if self.pk and self.updated:
+            cache.delete(self.body_html_cache_key)
+        super().save(*args, **kwargs)
+        # The vector is computed by PostgreSQL, so it needs a second statement
+        Post.objects.filter(pk=self.pk).update(search_vector=self.SEARCH_VECTOR)
+
+    @property
+    def body_html_cache_key(self):
+        return f"post_body_html_{self.pk}_{self.updated.timestamp()}"
+
+    def get_body_html(self):
+        """
+        Body rendered from Markdown, only parsed again when the post changes.
+        """
+        body_html = cache.get(self.body_html_cache_key)
+        if body_html is None:
+            body_html = mistune.html(self.body)
+            cache.set(self.body_html_cache_key, body_html, None)
+
+        return body_html
+
     def get_absolute_url(self):
         return reverse(
             "blog:post_detail",
@@ -57,6 +99,47 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ("created",)
+        indexes = (models.Index(fields=["post", "created", "id"], name="blog_comment_keyset"),)
 
     def __str__(self):
         return f"Comment on {self.post} by {self.name}"
+
+
+class SimilarPost(models.Model):
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="+")
+    similar = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="+")
+    shared_tags = models.PositiveIntegerField()
+
+    class Meta:
+        unique_together = (("post", "similar"),)
+        indexes = (
+            models.Index(fields=["post", "-shared_tags"], name="blog_similar_ranking"),
+        )
+
+    def __str__(self):
+        return f"{self.post} shares {self.shared_tags} tags with {self.similar}"
+
+
+class QueuedEmail(models.Model):
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    )
+
+    subject = models.CharField(max_length=250)
+    body = models.TextField()
+    from_email = models.EmailField()
+    to = models.EmailField()
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default="pending", db_index=True
+    )
+    error = models.TextField(blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    sent = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("created",)
+
+    def __str__(self):
+        return f"{self.subject} to {self.to} ({self.status})"
@@ -0,0 +1,32 @@
+from django.core.cache import cache
+
+from .models import Post
+
+SIDEBAR_CACHE_KEY = "blog_sidebar"
+SIDEBAR_CACHE_TIMEOUT = 60 * 15
+SIDEBAR_MAX_POSTS = 10
+
+
+def get_sidebar_data():
+    """
+    Post count, latest posts and most commented posts shown on every page.
+
+    Computed together and cached until a post or comment changes.
+    """
+    data = cache.get(SIDEBAR_CACHE_KEY)
+    if data is None:
+        posts = Post.published.only("title", "slug", "publish")
+        data = {
+            "total_posts": Post.published.count(),
+            "latest_posts": list(posts.order_by("-publish")[:SIDEBAR_MAX_POSTS]),
+            "most_commented_posts": list(
+                posts.order_by("-total_comments", "-publish")[:SIDEBAR_MAX_POSTS]
+            ),
+        }
+        cache.set(SIDEBAR_CACHE_KEY, data, SIDEBAR_CACHE_TIMEOUT)
+
+    return data
+
+
+def clear_sidebar_cache():
+    cache.delete(SIDEBAR_CACHE_KEY)
@@ -0,0 +1,53 @@
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .decorators import clear_posts_state_cache
+from .models import Comment, Post
+from .sidebar import clear_sidebar_cache
+from .similar import refresh_similar_posts
+
+
+@receiver(pre_save, sender=Comment)
+def comment_saving(sender, instance, **kwargs):
+    instance._was_active = bool(
+        instance.pk and Comment.objects.filter(pk=instance.pk, active=True).exists()
+    )
+
+
+@receiver(post_save, sender=Comment)
+def comment_saved(sender, instance, created, **kwargs):
+    active_delta = int(instance.active) - int(instance._was_active)
+    if created or active_delta:
+        Post.objects.filter(pk=instance.post_id).update(
+            total_comments=F("total_comments") + int(created),
+            active_comment_count=F("active_comment_count") + active_delta,
+        )
+    clear_sidebar_cache()
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, **kwargs):
+    Post.objects.filter(pk=instance.post_id).update(
+        total_comments=F("total_comments") - 1,
+        active_comment_count=F("active_comment_count") - int(instance.active),
+    )
+    clear_sidebar_cache()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def post_changed(sender, instance, **kwargs):
+    clear_sidebar_cache()
+    clear_posts_state_cache()
+
+
+@receiver(post_save, sender=Post)
+def post_saved(sender, instance, **kwargs):
+    refresh_similar_posts(instance)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def post_tags_changed(sender, instance, action, **kwargs):
+    if isinstance(instance, Post) and action in ("post_add", "post_remove", "post_clear"):
+        refresh_similar_posts(instance)
@@ -0,0 +1,41 @@
+from django.db import transaction
+from django.db.models import Count, Q
+
+from .models import Post, SimilarPost
+
+
+@transaction.atomic
+def refresh_similar_posts(post):
+    """
+    Recompute the rows of the tag overlap table involving the given post.
+    """
+    SimilarPost.objects.filter(Q(post=post) | Q(similar=post)).delete()
+    if post.status != "published":
+        return
+
+    overlaps = (
+        Post.published.filter(tags__in=post.tags.all())
+        .exclude(id=post.id)
+        .values("id")
+        .annotate(shared_tags=Count("id"))
+        .values_list("id", "shared_tags")
+    )
+
+    rows = []
+    for similar_id, shared_tags in overlaps:
+        rows.append(
+            SimilarPost(post_id=post.id, similar_id=similar_id, shared_tags=shared_tags)
+        )
+        rows.append(
+            SimilarPost(post_id=similar_id, similar_id=post.id, shared_tags=shared_tags)
+        )
+    SimilarPost.objects.bulk_create(rows)
+
+
+def get_similar_posts(post, count=4):
+    similar = (
+        SimilarPost.objects.filter(post=post)
+        .select_related("similar")
+        .order_by("-shared_tags", "-similar__publish")[:count]
+    )
+    return [row.similar for row in similar]
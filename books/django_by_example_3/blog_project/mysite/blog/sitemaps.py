@@ -1,12 +1,121 @@
-from django.contrib.sitemaps import Sitemap
+import datetime
+import glob
+import hashlib
+import os
+import tempfile
+
+from django.conf import settings
+from django.http import FileResponse, Http404, StreamingHttpResponse
+from django.template.response import TemplateResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import escape
+from django.views.decorators.http import condition
+
+from .decorators import cache_until_posts_change, get_etag, get_last_modified
 from .models import Post
 
-class PostSitemap(Sitemap):
-    changefreq = "weekly"
-    priority = 0.9
 
-    def items(self):
-        return Post.published.all()
+@cache_until_posts_change
+def sitemap_index(request):
+    """
+    Sitemap index with one section per month that has published posts.
+    """
+    months = Post.published.dates("publish", "month", order="DESC")
+    sitemaps = [
+        request.build_absolute_uri(
+            reverse("sitemap_section", args=[month.year, month.month])
+        )
+        for month in months
+    ]
+    return TemplateResponse(
+        request,
+        "sitemap_index.xml",
+        {"sitemaps": sitemaps},
+        content_type="application/xml",
+    )
+
+
+@condition(etag_func=get_etag, last_modified_func=get_last_modified)
+def sitemap_section(request, year, month):
+    """
+    Sitemap of the posts published in a month.
+
+    Streamed straight from the database the first time, while a copy is
+    written to SITEMAP_CACHE_DIR and served until posts change.
+    """
+    try:
+        start = timezone.make_aware(datetime.datetime(year, month, 1))
+        end = timezone.make_aware(
+            datetime.datetime(year + month // 12, month % 12 + 1, 1)
+        )
+    except (ValueError, OverflowError):
+        # Month or year out of range
+        raise Http404()
+
+    # Named after the host, as the file has absolute URLs, and the state of
+    # the posts, so a file is never served once posts changed
+    host = hashlib.sha1(request.get_host().encode()).hexdigest()[:8]
+    prefix = os.path.join(
+        settings.SITEMAP_CACHE_DIR, f"posts-{year}-{month:02d}-{host}"
+    )
+    etag = get_etag()
+    path = f"{prefix}-{etag}.xml"
+    if os.path.exists(path):
+        return FileResponse(open(path, "rb"), content_type="application/xml")
+
+    posts = (
+        Post.published.filter(publish__gte=start, publish__lt=end)
+        .only("slug", "publish", "updated")
+        .order_by("publish")
+    )
+    return StreamingHttpResponse(
+        write_section(request, posts, prefix, etag), content_type="application/xml"
+    )
+
+
+def write_section(request, posts, prefix, etag):
+    """
+    Yield the section while writing it to a temporary file, which becomes
+    the cached one only if it was written in full and no post changed
+    meanwhile. Files of previous states are removed.
+    """
+    directory = os.path.dirname(prefix)
+    os.makedirs(directory, exist_ok=True)
+    f = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False
+    )
+    try:
+        with f:
+            for chunk in render_section(request, posts):
+                f.write(chunk)
+                yield chunk
+
+        if get_etag() == etag:
+            path = f"{prefix}-{etag}.xml"
+            os.replace(f.name, path)
+            for old_path in glob.glob(f"{glob.escape(prefix)}-*.xml"):
+                if old_path != path:
+                    try:
+                        os.remove(old_path)
+                    except FileNotFoundError:
+                        # Removed by another response meanwhile
+                        pass
+    finally:
+        if os.path.exists(f.name):
+            os.remove(f.name)
+
+
+def render_section(request, posts):
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+
+    for post in posts.iterator():
+        location = escape(request.build_absolute_uri(post.get_absolute_url()))
+        yield (
+            f"<url><loc>{location}</loc>"
+            f"<lastmod>{post.updated.date().isoformat()}</lastmod>"
+            "<changefreq>weekly</changefreq><priority>0.9</priority></url>\n"
+        )
 
-    def lastmod(self, obj):
-        return obj.updated
+    yield "</urlset>\n"
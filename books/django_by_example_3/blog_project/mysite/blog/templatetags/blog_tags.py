@@ -1,31 +1,33 @@
-import mistune
 from django import template
-from django.db.models import Count
 from django.utils.safestring import mark_safe
 
-from ..models import Post
+from ..sidebar import get_sidebar_data
+from ..similar import get_similar_posts
 
 register = template.Library()
 
 
 @register.simple_tag
 def total_posts():
-    return Post.published.count()
+    return get_sidebar_data()["total_posts"]
 
 
 @register.inclusion_tag("blog/post/latest_posts.html")
 def latest_posts(count=5):
-    latest_posts = Post.published.order_by("-publish")[:count]
+    latest_posts = get_sidebar_data()["latest_posts"][:count]
     return {"latest_posts": latest_posts}
 
 
 @register.simple_tag
 def get_most_commented_posts(count=5):
-    return Post.published.annotate(total_comments=Count("comments")).order_by(
-        "-total_comments"
-    )[:count]
+    return get_sidebar_data()["most_commented_posts"][:count]
+
+
+@register.inclusion_tag("blog/post/similar_posts.html")
+def similar_posts(post, count=4):
+    return {"similar_posts": get_similar_posts(post, count)}
 
 
 @register.filter
-def markdown(content):
-    return mark_safe(mistune.html(content))
+def post_body(post):
+    return mark_safe(post.get_body_html())
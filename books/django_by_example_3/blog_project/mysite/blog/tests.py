@@ -1,3 +1,180 @@
+import datetime
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.db import connection
 from django.test import TestCase
+from django.utils import timezone
+
+from .emails import send_queued_emails
+from .models import Post, QueuedEmail
+
 
 # Create your tests here.
+class PostDetailLookupTest(TestCase):
+    def setUp(self):
+        author = User.objects.create_user("author")
+        self.post = Post.objects.create(
+            title="Hello", slug="hello", author=author, body="...", status="published"
+        )
+
+    def test_lookup_uses_slug_publish_index(self):
+        day_start = timezone.make_aware(
+            datetime.datetime(
+                self.post.publish.year, self.post.publish.month, self.post.publish.day
+            )
+        )
+        posts = Post.objects.filter(
+            slug="hello",
+            status="published",
+            publish__gte=day_start,
+            publish__lt=day_start + datetime.timedelta(days=1),
+        )
+
+        # With a handful of rows PostgreSQL would rather scan the table
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = off")
+        try:
+            plan = posts.explain()
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute("SET enable_seqscan = on")
+
+        self.assertIn("blog_post_slug_publish", plan)
+
+    def test_detail_page(self):
+        response = self.client.get(self.post.get_absolute_url())
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_page_invalid_date(self):
+        response = self.client.get("/blog/2020/2/31/hello/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_comments_invalid_cursor(self):
+        response = self.client.get(
+            f"/blog/comments/{self.post.pk}/", {"after": "2020-02-31T00:00:00|1"}
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+class FeedCacheTest(TestCase):
+    def setUp(self):
+        author = User.objects.create_user("author")
+        self.post = Post.objects.create(
+            title="Hello", slug="hello", author=author, body="...", status="published"
+        )
+
+    def test_unpublished_post_leaves_feed(self):
+        response = self.client.get("/blog/feed/")
+        self.assertContains(response, "Hello")
+
+        self.post.status = "draft"
+        self.post.save()
+
+        response = self.client.get("/blog/feed/")
+        self.assertNotContains(response, "Hello")
+
+    def test_conditional_get(self):
+        response = self.client.get("/blog/feed/")
+        etag = response["ETag"]
+
+        response = self.client.get("/blog/feed/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.post.status = "draft"
+        self.post.save()
+        response = self.client.get("/blog/feed/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_cached_response_keeps_headers(self):
+        first = self.client.get("/blog/feed/")
+        second = self.client.get("/blog/feed/")
+        self.assertEqual(second["Content-Type"], first["Content-Type"])
+        self.assertEqual(second.content, first.content)
+
+    def test_deleted_post_leaves_feed(self):
+        self.client.get("/blog/feed/")
+        self.post.delete()
+
+        response = self.client.get("/blog/feed/")
+        self.assertNotContains(response, "Hello")
+
+
+# The test runner swaps the SMTP backend for the locmem one
+class SendQueuedEmailsTest(TestCase):
+    def setUp(self):
+        for i in range(3):
+            QueuedEmail.objects.create(
+                subject=f"Post {i}",
+                body="...",
+                from_email="admin@myblog.com",
+                to=f"reader{i}@example.com",
+            )
+
+    def test_send(self):
+        self.assertEqual(send_queued_emails(), 3)
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(QueuedEmail.objects.filter(status="sent").count(), 3)
+        self.assertEqual(send_queued_emails(), 0)
+
+    def test_rejected_email_fails(self):
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=[1, SMTPRecipientsRefused({}), 1],
+        ):
+            self.assertEqual(send_queued_emails(), 2)
+
+        self.assertEqual(QueuedEmail.objects.get(subject="Post 1").status, "failed")
+
+    def test_disconnect_leaves_rest_pending(self):
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=[1, SMTPServerDisconnected()],
+        ):
+            self.assertEqual(send_queued_emails(), 1)
+
+        self.assertEqual(QueuedEmail.objects.filter(status="pending").count(), 2)
+
+    def test_server_down(self):
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.open",
+            side_effect=ConnectionRefusedError(),
+        ):
+            self.assertEqual(send_queued_emails(), 0)
+
+        self.assertEqual(QueuedEmail.objects.filter(status="pending").count(), 3)
+
+
+class SitemapSectionTest(TestCase):
+    def test_out_of_range(self):
+        for url in (
+            "/sitemap-posts-0-1.xml",
+            "/sitemap-posts-99999-1.xml",
+            "/sitemap-posts-2020-13.xml",
+        ):
+            self.assertEqual(self.client.get(url).status_code, 404)
+
+
+class PostSearchTest(TestCase):
+    def setUp(self):
+        author = User.objects.create_user("author")
+        self.post = Post.objects.create(
+            title="Django tutorial",
+            slug="django-tutorial",
+            author=author,
+            body="Models, views and templates.",
+            status="published",
+        )
+
+    def test_ranked_search(self):
+        response = self.client.get("/blog/", {"search": "django"})
+        self.assertEqual(list(response.context["posts"]), [self.post])
+        self.assertIsNone(response.context["suggestion"])
+
+    def test_misspelled_search_falls_back_to_trigrams(self):
+        response = self.client.get("/blog/", {"search": "djang tutorial"})
+        self.assertEqual(list(response.context["posts"]), [self.post])
+        self.assertEqual(response.context["suggestion"], "Django tutorial")
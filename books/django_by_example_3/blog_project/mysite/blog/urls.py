@@ -1,6 +1,7 @@
 from django.urls import path
 
 from . import views
+from .decorators import cache_until_posts_change
 from .feeds import LatestPostsFeed
 
 app_name = "blog"
@@ -13,5 +14,6 @@ urlpatterns = [
         name="post_detail",
     ),
     path("share/<int:pk>/", views.post_share, name="post_share"),
-    path("feed/", LatestPostsFeed(), name="post_feed"),
+    path("comments/<int:pk>/", views.post_comments, name="post_comments"),
+    path("feed/", cache_until_posts_change(LatestPostsFeed()), name="post_feed"),
 ]
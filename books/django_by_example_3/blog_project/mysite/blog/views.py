@@ -1,7 +1,13 @@
+import datetime
+
+from django.http import Http404
 from django.shortcuts import render, get_object_or_404
 from django.core.paginator import Page, Paginator, EmptyPage, PageNotAnInteger
 from django.views.generic import ListView
-from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from .models import Post
 from .forms import CommentForm, PostShareForm, SearchForm
 
@@ -14,31 +20,49 @@ class PostListView(ListView):
     def get_context_data(self, **kwargs):
         data = super().get_context_data()
         data["search_form"] = SearchForm(self.request.GET)
+        data["suggestion"] = self.suggestion
         return data
 
     def get_queryset(self):
+        self.suggestion = None
         search = self.request.GET.get("search")
         if search:
-            search_vector = SearchVector("title", weight="A") + SearchVector("body", weight="B")
             search_query = SearchQuery(search)
-            return Post.published.annotate(
-                search_vector=search_vector,
-                search_rank=SearchRank(search_vector, search_query)
-            ).filter(search_vector=search_query, search_rank__gte=0.3).order_by("-search_rank")
+            # Evaluated once, so the paginator counts and slices the list
+            # instead of querying again
+            posts = list(Post.published.filter(search_vector=search_query).annotate(
+                search_rank=SearchRank(F("search_vector"), search_query)
+            ).filter(search_rank__gte=0.3).order_by("-search_rank"))
+            if posts:
+                return posts
+
+            # Nothing ranked well enough: fall back to near matches on the title,
+            # served by the trigram index
+            posts = list(Post.published.filter(title__trigram_similar=search).annotate(
+                similarity=TrigramSimilarity("title", search)
+            ).order_by("-similarity"))
+            if posts:
+                self.suggestion = posts[0].title
+            return posts
 
         return Post.published.all()
 
 
 def post_detail(request, year, month, day, slug):
+    try:
+        day_start = timezone.make_aware(datetime.datetime(year, month, day))
+    except ValueError:
+        raise Http404()
+
+    # A range on publish instead of publish__year/month/day, so the lookup
+    # is served by the (slug, publish) index
     post = get_object_or_404(
         Post,
         slug=slug,
         status="published",
-        publish__year=year,
-        publish__month=month,
-        publish__day=day,
+        publish__gte=day_start,
+        publish__lt=day_start + datetime.timedelta(days=1),
     )
-    comments = post.comments.filter(active=True)
 
     new_comment = False
     comment_form = CommentForm()
@@ -49,15 +73,61 @@ def post_detail(request, year, month, day, slug):
             new_comment = comment_form.save(commit=False)
             new_comment.post = post
             new_comment.save()
+            post.refresh_from_db(fields=["active_comment_count"])
+
+    comments, next_cursor = get_comments_page(post)
 
     return render(request, "blog/post/detail.html", {
         "post": post,
         "comments": comments,
+        "next_cursor": next_cursor,
         "new_comment": new_comment,
         "comment_form": comment_form
     })
 
 
+COMMENTS_PER_PAGE = 20
+
+
+def get_comments_page(post, after=None):
+    """
+    A page of active comments ordered by (created, id), starting after the
+    cursor returned with the previous page.
+    """
+    comments = post.comments.filter(active=True).order_by("created", "id")
+
+    if after:
+        created, _, id = after.rpartition("|")
+        try:
+            created = parse_datetime(created)
+        except (ValueError, TypeError):
+            # Well formed but impossible, like February 31st
+            raise Http404()
+        if created and id.isdigit():
+            comments = comments.filter(
+                Q(created__gt=created) | Q(created=created, id__gt=id)
+            )
+
+    comments = list(comments[: COMMENTS_PER_PAGE + 1])
+    next_cursor = None
+    if len(comments) > COMMENTS_PER_PAGE:
+        comments = comments[:COMMENTS_PER_PAGE]
+        last = comments[-1]
+        next_cursor = f"{last.created.isoformat()}|{last.id}"
+
+    return comments, next_cursor
+
+
+def post_comments(request, pk):
+    post = get_object_or_404(Post, pk=pk, status="published")
+    comments, next_cursor = get_comments_page(post, request.GET.get("after"))
+    return render(request, "blog/post/comments.html", {
+        "post": post,
+        "comments": comments,
+        "next_cursor": next_cursor,
+    })
+
+
 def post_share(request, pk):
     post = get_object_or_404(Post, pk=pk)
     email_sent = False
@@ -94,6 +94,15 @@ DATABASES = {
     }
 }
 
+# Shared by every process, so what one process clears, all of them see. The
+# table is created by the blog migrations, or with manage.py createcachetable
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'blog_cache',
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
@@ -132,3 +141,6 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/3.0/howto/static-files/
 
 STATIC_URL = '/static/'
+
+# Sitemap sections written to disk by blog.sitemaps
+SITEMAP_CACHE_DIR = os.path.join(BASE_DIR, 'sitemaps')
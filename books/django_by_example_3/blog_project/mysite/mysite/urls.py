@@ -14,17 +14,13 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.contrib.sitemaps.views import sitemap
 from django.urls import include, path
 
-from blog.sitemaps import PostSitemap
-
-sitemaps = {
-    "posts": PostSitemap
-}
+from blog.sitemaps import sitemap_index, sitemap_section
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('blog/', include('blog.urls')),
-    path("sitemap.xml", sitemap, {"sitemaps": sitemaps}, name="django.contrib.sitemaps.views.sitemap")
+    path("sitemap.xml", sitemap_index, name="sitemap_index"),
+    path("sitemap-posts-<int:year>-<int:month>.xml", sitemap_section, name="sitemap_section"),
 ]
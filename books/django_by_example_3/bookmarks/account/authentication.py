@@ -1,23 +1,57 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.functions import Lower
+
+USER_CACHE_TIMEOUT = 60
+
+
+def user_cache_key(user_id):
+    return f"auth_user_{user_id}"
+
+
+def users_by_email(email):
+    """
+    Users with the given e-mail, ignoring case, looked up by index.
+    """
+    User = get_user_model()
+    return (
+        User.objects.exclude(email="")
+        .annotate(email_lower=Lower("email"))
+        .filter(email_lower=email.lower())
+    )
+
 
 class EmailAuthBackend:
     """
     Allow user to authenticate using e-mail and password
     """
-    def authenticate(self, requer, username=None, password=None):
-        try:
-            User = get_user_model()
-            user = User.objects.get(email=username)
-            if user.check_password(password):
-                return user
-            else:
-                return None
-        except User.DoesNotExist:
+    def authenticate(self, request, username=None, password=None):
+        if not username:
             return None
 
-    def get_user(self, user_id):
         User = get_user_model()
         try:
-            return User.objects.get(id=user_id)
+            user = users_by_email(username).get()
         except User.DoesNotExist:
             return None
+
+        if user.check_password(password):
+            return user
+        else:
+            return None
+
+    def get_user(self, user_id):
+        """
+        Cached for a short while, and cleared when the user is saved, as this
+        runs on every request of a logged in user.
+        """
+        user = cache.get(user_cache_key(user_id))
+        if user is None:
+            User = get_user_model()
+            try:
+                user = User.objects.get(id=user_id)
+            except User.DoesNotExist:
+                return None
+            cache.set(user_cache_key(user_id), user, USER_CACHE_TIMEOUT)
+
+        return user
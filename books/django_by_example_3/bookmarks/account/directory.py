@@ -0,0 +1,49 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.template.loader import render_to_string
+
+from common.pagination import keyset_page
+
+DIRECTORY_VERSION_KEY = "people_directory_version"
+DIRECTORY_CACHE_TIMEOUT = 60 * 15
+USERS_PER_PAGE = 24
+
+
+def get_directory_version():
+    return cache.get_or_set(DIRECTORY_VERSION_KEY, 1, None)
+
+
+def get_directory_page(cursor=None):
+    """
+    Rendered cards and next cursor for a page of the people directory.
+
+    Pages are cached under the current directory version, so bumping it
+    drops every page at once.
+    """
+    key = f"people_directory_{get_directory_version()}_{cursor or ''}"
+    page = cache.get(key)
+    if page is None:
+        User = get_user_model()
+        users = (
+            User.objects.filter(is_active=True)
+            .select_related("profile")
+            .only(
+                "username", "first_name", "last_name", "date_joined", "profile__photo"
+            )
+        )
+        users, next_cursor = keyset_page(
+            users, cursor, USERS_PER_PAGE, field="date_joined"
+        )
+        html = render_to_string("account/user/list_ajax.html", {"users": users})
+        page = (html, next_cursor)
+        cache.set(key, page, DIRECTORY_CACHE_TIMEOUT)
+
+    return page
+
+
+def clear_directory_cache():
+    try:
+        cache.incr(DIRECTORY_VERSION_KEY)
+    except ValueError:
+        # No page was cached yet
+        pass
@@ -30,6 +30,13 @@ class UserEditForm(forms.ModelForm):
         model = get_user_model()
         fields = ("first_name", "last_name", "email")
 
+    def clean_email(self):
+        email = self.cleaned_data["email"]
+        users = get_user_model().objects.filter(email__iexact=email)
+        if email and users.exclude(id=self.instance.id).exists():
+            raise forms.ValidationError("Email already in use")
+        return email
+
 
 class UserProfileForm(forms.ModelForm):
     class Meta:
@@ -0,0 +1,93 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from account.authentication import EmailAuthBackend, user_cache_key, users_by_email
+
+PASSWORD = "benchmark"
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the e-mail login lookup and get_user against generated users, "
+        "which are rolled back afterwards"
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--sizes",
+            dest="sizes",
+            type=int,
+            nargs="+",
+            default=[10000, 100000, 1000000],
+        )
+        parser.add_argument("--repeat", dest="repeat", type=int, default=200)
+
+    def handle(self, *args, **options):
+        backend = EmailAuthBackend()
+        repeat = options["repeat"]
+
+        for size in options["sizes"]:
+            with transaction.atomic():
+                users = self.create_users(size)
+                rng = random.Random(0)
+
+                def email():
+                    return f"User{rng.randrange(size)}@Example.com"
+
+                lookup = self.time(lambda: users_by_email(email()).get(), repeat)
+                # Mostly password hashing, which doesn't depend on the table
+                login = self.time(
+                    lambda: backend.authenticate(None, email(), PASSWORD),
+                    max(repeat // 20, 1),
+                )
+
+                user_id = rng.choice(users)
+                cache.delete(user_cache_key(user_id))
+                get_user = self.time(lambda: backend.get_user(user_id), repeat)
+                cache.delete(user_cache_key(user_id))
+
+                transaction.set_rollback(True)
+
+            self.stdout.write(
+                f"{size} users: e-mail lookup {lookup:.3f} ms, "
+                f"authenticate {login:.1f} ms, get_user {get_user:.3f} ms (median)"
+            )
+
+    def create_users(self, size):
+        User = get_user_model()
+        password = make_password(PASSWORD)
+        User.objects.bulk_create(
+            (
+                User(
+                    username=f"benchmark{i}",
+                    email=f"user{i}@example.com",
+                    password=password,
+                )
+                for i in range(size)
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE auth_user")
+
+        return list(
+            User.objects.filter(username__startswith="benchmark").values_list(
+                "id", flat=True
+            )[:1000]
+        )
+
+    def time(self, fx, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fx()
+            timings.append((time.perf_counter() - start) * 1000)
+
+        return statistics.median(timings)
@@ -0,0 +1,19 @@
+# Generated by Django 3.0.8 on 2026-10-18 16:10
+
+from django.db import migrations
+import easy_thumbnails.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_contact'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='photo',
+            field=easy_thumbnails.fields.ThumbnailerImageField(blank=True, upload_to='users/%Y/%m/%d/'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 3.0.8 on 2026-10-18 17:00
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def count_follows(apps, schema_editor):
+    Profile = apps.get_model('account', 'Profile')
+    Contact = apps.get_model('account', 'Contact')
+
+    def counts(field):
+        return Coalesce(models.Subquery(
+            Contact.objects.filter(**{field: models.OuterRef('user_id')}).values(field).annotate(
+                total=models.Count('pk')
+            ).values('total')
+        ), 0)
+
+    Profile.objects.update(
+        total_followers=counts('user_to'),
+        total_following=counts('user_from'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('account', '0003_profile_thumbnailer_field'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='total_followers',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='total_following',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddConstraint(
+            model_name='contact',
+            constraint=models.UniqueConstraint(fields=('user_from', 'user_to'), name='account_contact_unique'),
+        ),
+        migrations.RunPython(count_follows, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 3.0.8 on 2026-10-18 17:20
+
+from django.db import migrations
+from django.db.models.functions import Lower
+
+
+def clear_duplicate_emails(apps, schema_editor):
+    """
+    Keep each e-mail, ignoring case, only on the user who logged in last,
+    so the unique index can be created
+    """
+    User = apps.get_model("auth", "User")
+    users = (
+        User.objects.exclude(email="")
+        .annotate(email_lower=Lower("email"))
+        .order_by("email_lower", "-last_login", "id")
+        .values_list("id", "email_lower")
+    )
+
+    seen = set()
+    duplicates = []
+    for id, email in users.iterator():
+        if email in seen:
+            duplicates.append(id)
+        seen.add(email)
+
+    User.objects.filter(id__in=duplicates).update(email="")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # The later auth migrations rebuild auth_user on SQLite, which would
+        # drop the index
+        ('auth', '0011_update_proxy_permissions'),
+        ('account', '0004_follow_counts'),
+    ]
+
+    # E-mail lookups by EmailAuthBackend are case-insensitive. Users without
+    # an e-mail are told apart by their id, so they don't collide
+    operations = [
+        migrations.RunPython(clear_duplicate_emails, migrations.RunPython.noop),
+        migrations.RunSQL(
+            "CREATE UNIQUE INDEX account_user_email_ci ON auth_user "
+            "(LOWER(email), (CASE WHEN email = '' THEN id ELSE 0 END))",
+            "DROP INDEX account_user_email_ci",
+        ),
+    ]
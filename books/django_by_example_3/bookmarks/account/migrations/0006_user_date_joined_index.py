@@ -0,0 +1,19 @@
+# Generated by Django 3.0.8 on 2026-10-18 18:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0011_update_proxy_permissions'),
+        ('account', '0005_user_email_index'),
+    ]
+
+    # Keyset pages of the people directory, see account.directory
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX account_user_date_joined_id ON auth_user (date_joined, id)",
+            "DROP INDEX account_user_date_joined_id",
+        ),
+    ]
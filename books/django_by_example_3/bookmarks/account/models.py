@@ -1,13 +1,17 @@
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import models
+from easy_thumbnails.fields import ThumbnailerImageField
 
 
 # Create your models here.
 class Profile(models.Model):
     user = models.OneToOneField(get_user_model(), on_delete=models.CASCADE)
     date_of_birth = models.DateField(blank=True, null=True)
-    photo = models.ImageField(upload_to="users/%Y/%m/%d/", blank=True)
+    photo = ThumbnailerImageField(upload_to="users/%Y/%m/%d/", blank=True)
+    # Kept by the Contact signals
+    total_followers = models.PositiveIntegerField(default=0, editable=False)
+    total_following = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return f"Profile for user {self.user.username}"
@@ -24,6 +28,11 @@ class Contact(models.Model):
 
     class Meta:
         ordering = ("-created",)
+        constraints = (
+            models.UniqueConstraint(
+                fields=["user_from", "user_to"], name="account_contact_unique"
+            ),
+        )
 
     def __str__(self):
         return f"{self.user_from} follows {self.user_to} since {self.created}"
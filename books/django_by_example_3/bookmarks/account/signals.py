@@ -0,0 +1,42 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import user_cache_key
+from .directory import clear_directory_cache
+from .models import Contact, Profile
+
+
+def update_follow_counts(contact, amount):
+    Profile.objects.filter(user_id=contact.user_to_id).update(
+        total_followers=F("total_followers") + amount
+    )
+    Profile.objects.filter(user_id=contact.user_from_id).update(
+        total_following=F("total_following") + amount
+    )
+
+
+@receiver(post_save, sender=Contact)
+def contact_created(sender, instance, created, **kwargs):
+    if created:
+        update_follow_counts(instance, 1)
+
+
+@receiver(post_delete, sender=Contact)
+def contact_deleted(sender, instance, **kwargs):
+    update_follow_counts(instance, -1)
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def user_changed(sender, instance, **kwargs):
+    cache.delete(user_cache_key(instance.id))
+
+
+# Names and photos shown in the people directory
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def profile_changed(sender, instance, **kwargs):
+    clear_directory_cache()
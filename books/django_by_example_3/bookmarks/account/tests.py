@@ -1,3 +1,87 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from common.pagination import encode_cursor, keyset_filter
+from images.models import Image
+
+from .authentication import users_by_email
+from .forms import UserEditForm
+from .views import USER_IMAGES_PER_PAGE, user_images
+
 
 # Create your tests here.
+class UserImagesTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user("user")
+        Image.objects.bulk_create(
+            Image(user=cls.user, title=f"Image {i}", slug=f"image-{i}", status="ready")
+            for i in range(USER_IMAGES_PER_PAGE * 2 + 1)
+        )
+        Image.objects.create(user=cls.user, title="Pending", slug="pending")
+
+    def get(self, cursor=""):
+        request = RequestFactory().get("/", {"cursor": cursor})
+        request.user = self.user
+        return user_images(request, self.user.username)
+
+    def test_page_queries(self):
+        # The user and the page of images, however many images there are
+        with self.assertNumQueries(2):
+            response = self.get()
+
+        self.assertEqual(
+            response.content.count(b'class="image"'), USER_IMAGES_PER_PAGE
+        )
+        self.assertNotIn(b"Pending", response.content)
+
+    def test_pages(self):
+        sizes = []
+        cursor = ""
+        while True:
+            response = self.get(cursor)
+            sizes.append(response.content.count(b'class="image"'))
+            cursor = response["X-Next-Cursor"]
+            if not cursor:
+                break
+
+        self.assertEqual(sizes, [USER_IMAGES_PER_PAGE, USER_IMAGES_PER_PAGE, 1])
+
+
+class EmailLookupTest(TestCase):
+    def test_lookup_uses_email_index(self):
+        plan = users_by_email("User@Example.com").explain()
+        self.assertIn("account_user_email_ci", plan)
+
+    def test_lookup_ignores_case(self):
+        user = get_user_model().objects.create_user(
+            "user", email="User@Example.com"
+        )
+        get_user_model().objects.create_user("other")
+
+        self.assertEqual(list(users_by_email("user@example.COM")), [user])
+
+
+class UserEditFormTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        User.objects.create_user("other", email="Other@Example.com")
+        self.user = User.objects.create_user("user", email="user@example.com")
+
+    def test_email_taken_ignoring_case(self):
+        form = UserEditForm(instance=self.user, data={"email": "other@example.COM"})
+        self.assertFalse(form.is_valid())
+        self.assertIn("email", form.errors)
+
+    def test_own_email(self):
+        form = UserEditForm(instance=self.user, data={"email": "User@Example.com"})
+        self.assertTrue(form.is_valid())
+
+
+class DirectoryPageTest(TestCase):
+    def test_page_uses_date_joined_index(self):
+        users = get_user_model().objects.filter(is_active=True)
+        cursor = encode_cursor(timezone.now(), 1)
+        plan = keyset_filter(users, cursor, field="date_joined")[:25].explain()
+        self.assertIn("account_user_date_joined_id", plan)
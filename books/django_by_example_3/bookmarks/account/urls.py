@@ -11,6 +11,7 @@ urlpatterns = [
     path("", include("django.contrib.auth.urls")),
     path("dashboard/", views.dashboard, name="dashboard"),
     path("users/follow/", views.user_follow, name="user_follow"),
+    path("users/<username>/images/", views.user_images, name="user_images"),
     path("users/<username>/", views.user_detail, name="user_detail"),
     path("users/", views.user_list, name="user_list"),
 ]
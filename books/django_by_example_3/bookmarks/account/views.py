@@ -1,14 +1,20 @@
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, render
+from django.utils.safestring import mark_safe
 from django.views.decorators.http import require_POST
 
+from actions import feed
 from actions.models import Action
+from actions.targets import hydrate_targets
 from actions.utils import create_action
 from common.decorators import require_AJAX
+from common.pagination import keyset_page
+from images.models import Image
 
+from .directory import get_directory_page
 from .forms import UserEditForm, UserProfileForm, UserRegistrationForm
 from .models import Contact, Profile
 
@@ -16,14 +22,12 @@ from .models import Contact, Profile
 # Create your views here.
 @login_required()
 def dashboard(request):
-    actions = Action.objects.exclude(user=request.user)
-    following_ids = request.user.following.values_list("id", flat=True)
-
-    if following_ids:
-        actions.filter(user_id__in=following_ids)
-
-    actions = actions.select_related("user", "user__profile").prefetch_related("target")
-    actions = actions[:10]
+    if request.user.following.exists():
+        actions = feed.get_feed(request.user, 10)
+    else:
+        actions = Action.objects.exclude(user=request.user)
+        actions = actions.select_related("user", "user__profile")
+        actions = hydrate_targets(actions[:10])
 
     return render(
         request, "account/dashboard.html", {"section": "dashboard", "actions": actions}
@@ -72,22 +76,73 @@ def register(request):
 
 @login_required
 def user_list(request):
-    User = get_user_model()
-    users = User.objects.filter(is_active=True)
-    return render(
-        request, "account/user/list.html", {"users": users, "section": "people"}
+    users_html, next_cursor = get_directory_page(request.GET.get("cursor"))
+
+    if request.is_ajax():
+        response = HttpResponse(users_html)
+        response["X-Next-Cursor"] = next_cursor or ""
+        return response
+    else:
+        return render(
+            request,
+            "account/user/list.html",
+            {
+                "users_html": mark_safe(users_html),
+                "next_cursor": next_cursor,
+                "section": "people",
+            },
+        )
+
+
+USER_IMAGES_PER_PAGE = 12
+
+
+def get_user_images_page(user, cursor=None):
+    images = Image.objects.filter(user=user, status="ready").only(
+        "title", "slug", "image", "created"
     )
+    return keyset_page(images, cursor, USER_IMAGES_PER_PAGE)
 
 
 @login_required
 def user_detail(request, username):
     User = get_user_model()
-    user = get_object_or_404(User, username=username, is_active=True)
+    user = get_object_or_404(
+        User.objects.select_related("profile"), username=username, is_active=True
+    )
+    is_following = Contact.objects.filter(
+        user_from=request.user, user_to=user
+    ).exists()
+    images, next_cursor = get_user_images_page(user)
     return render(
-        request, "account/user/detail.html", {"user": user, "section": "people"}
+        request,
+        "account/user/detail.html",
+        {
+            "user": user,
+            "is_following": is_following,
+            "images": images,
+            "next_cursor": next_cursor,
+            "section": "people",
+        },
     )
 
 
+@login_required
+def user_images(request, username):
+    """
+    Further pages of the gallery on the user detail page
+    """
+    User = get_user_model()
+    user = get_object_or_404(
+        User.objects.only("id"), username=username, is_active=True
+    )
+    images, next_cursor = get_user_images_page(user, request.GET.get("cursor"))
+
+    response = render(request, "images/image/list_ajax.html", {"images": images})
+    response["X-Next-Cursor"] = next_cursor or ""
+    return response
+
+
 @require_AJAX
 @require_POST
 @login_required
@@ -103,10 +158,17 @@ def user_follow(request):
             if action == "follow":
                 Contact.objects.get_or_create(user_from=request.user, user_to=user)
                 create_action(request.user, "started following", user)
+                feed.follow(request.user, user)
             else:
                 Contact.objects.filter(user_from=request.user, user_to=user).delete()
+                feed.unfollow(request.user, user)
 
-            total_followers = user.followers.count()
+            total_followers = (
+                Profile.objects.filter(user=user)
+                .values_list("total_followers", flat=True)
+                .first()
+                or 0
+            )
 
             return JsonResponse(
                 {"status": "ok", "action": action, "total_followers": total_followers}
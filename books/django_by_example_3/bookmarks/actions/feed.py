@@ -0,0 +1,100 @@
+import logging
+
+from django.conf import settings
+from redis.exceptions import RedisError
+
+from common.redis import redis
+
+from .models import Action
+from .targets import hydrate_targets
+
+logger = logging.getLogger(__name__)
+
+# Users whose actions are not pushed to their followers because they have
+# too many of them. Their actions are merged into the feed when it's read.
+FANOUT_SKIPPED_KEY = "feed:fanout_skipped"
+
+
+def feed_key(user_id):
+    return f"feed:{user_id}"
+
+
+def push_action(action):
+    """
+    Add a new action to the feed of everyone following its author.
+
+    The feed is best effort: the action is already saved, so Redis errors
+    are only logged.
+    """
+    followers = list(action.user.followers.values_list("id", flat=True))
+    if not followers:
+        return
+
+    try:
+        if len(followers) > settings.FEED_FANOUT_LIMIT:
+            redis.sadd(FANOUT_SKIPPED_KEY, action.user_id)
+            return
+
+        score = action.created.timestamp()
+        pipe = redis.pipeline(transaction=False)
+        for follower_id in followers:
+            pipe.zadd(feed_key(follower_id), {action.id: score})
+            pipe.zremrangebyrank(feed_key(follower_id), 0, -settings.FEED_SIZE - 1)
+        pipe.execute()
+    except RedisError:
+        logger.exception("Could not push action %s to the feeds", action.id)
+
+
+def follow(user, followed):
+    """
+    Bring the latest actions of a newly followed user into the feed.
+    """
+    actions = Action.objects.filter(user=followed).values_list("id", "created")
+    actions = {id: created.timestamp() for id, created in actions[: settings.FEED_SIZE]}
+    if actions:
+        try:
+            pipe = redis.pipeline(transaction=False)
+            pipe.zadd(feed_key(user.id), actions)
+            pipe.zremrangebyrank(feed_key(user.id), 0, -settings.FEED_SIZE - 1)
+            pipe.execute()
+        except RedisError:
+            logger.exception("Could not add the actions of %s to a feed", followed.id)
+
+
+def unfollow(user, followed):
+    """
+    Drop the latest actions of an unfollowed user from the feed. Older ones
+    left behind are filtered out when the feed is read.
+    """
+    ids = Action.objects.filter(user=followed).values_list("id", flat=True)
+    ids = list(ids[: settings.FEED_SIZE])
+    if ids:
+        try:
+            redis.zrem(feed_key(user.id), *ids)
+        except RedisError:
+            logger.exception(
+                "Could not remove the actions of %s from a feed", followed.id
+            )
+
+
+def get_feed(user, count=10):
+    """
+    Latest actions of the users someone follows, newest first.
+    """
+    following_ids = set(user.following.values_list("id", flat=True))
+    try:
+        ids = [int(id) for id in redis.zrevrange(feed_key(user.id), 0, count - 1)]
+        skipped_ids = {int(id) for id in redis.smembers(FANOUT_SKIPPED_KEY)}
+    except RedisError:
+        logger.exception("Could not read a feed, reading it from the database")
+        ids, skipped_ids = [], following_ids
+
+    pulled_ids = following_ids & skipped_ids
+    if pulled_ids:
+        ids += Action.objects.filter(user_id__in=pulled_ids).values_list(
+            "id", flat=True
+        )[:count]
+
+    actions = Action.objects.filter(id__in=ids, user_id__in=following_ids)
+    actions = actions.select_related("user", "user__profile")
+    return hydrate_targets(actions[:count])
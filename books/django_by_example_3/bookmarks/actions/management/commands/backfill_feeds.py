@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from account.models import Contact
+from actions import feed
+
+
+class Command(BaseCommand):
+    help = "Fill the Redis feeds from the follow relations already stored"
+
+    def handle(self, *args, **options):
+        contacts = Contact.objects.select_related("user_from", "user_to")
+        total = 0
+        for contact in contacts.iterator():
+            feed.follow(contact.user_from, contact.user_to)
+            total += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Filled feeds for {total} follows"))
@@ -0,0 +1,18 @@
+# Generated by Django 3.0.8 on 2026-10-18 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('actions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='action',
+            name='dedupe_key',
+            field=models.CharField(blank=True, editable=False, max_length=40, null=True, unique=True),
+        ),
+    ]
@@ -23,6 +23,10 @@ class Action(models.Model):
     )
     target_id = models.PositiveIntegerField(blank=True, null=True, db_index=True)
     target = GenericForeignKey("target_ct", "target_id")
+    # Same user, verb and target within the same minute, see create_action
+    dedupe_key = models.CharField(
+        max_length=40, unique=True, null=True, blank=True, editable=False
+    )
 
     class Meta:
         ordering = ("-created",)
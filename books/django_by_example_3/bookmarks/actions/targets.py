@@ -0,0 +1,42 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+
+from .models import Action
+
+
+# Related objects the action templates show for each kind of target
+TARGET_SELECT_RELATED = {
+    "auth.user": ("profile",),
+}
+
+
+def hydrate_targets(actions):
+    """
+    Load the targets of the given actions with one query per content type,
+    instead of one per action through the generic foreign key.
+    """
+    actions = list(actions)
+    target_field = Action._meta.get_field("target")
+
+    ids_by_ct = defaultdict(set)
+    for action in actions:
+        if action.target_ct_id:
+            ids_by_ct[action.target_ct_id].add(action.target_id)
+
+    targets_by_ct = {}
+    for ct_id, ids in ids_by_ct.items():
+        model = ContentType.objects.get_for_id(ct_id).model_class()
+        targets = model._default_manager.all()
+        select_related = TARGET_SELECT_RELATED.get(model._meta.label_lower)
+        if select_related:
+            targets = targets.select_related(*select_related)
+        targets_by_ct[ct_id] = targets.in_bulk(ids)
+
+    for action in actions:
+        target = None
+        if action.target_ct_id:
+            target = targets_by_ct[action.target_ct_id].get(action.target_id)
+        target_field.set_cached_value(action, target)
+
+    return actions
@@ -1,3 +1,167 @@
-from django.test import TestCase
+import threading
+from unittest import mock
+
+import fakeredis
+from redis.exceptions import ConnectionError
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from account.models import Contact, Profile
+from images.models import Image
+
+from . import feed
+from .models import Action
+from .targets import hydrate_targets
+from .utils import create_action
+
 
 # Create your tests here.
+class HydrateTargetsTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user("user")
+
+        for i in range(3):
+            followed = User.objects.create_user(f"followed{i}")
+            Profile.objects.create(user=followed)
+            Action.objects.create(user=self.user, verb="started following", target=followed)
+
+            image = Image.objects.create(user=self.user, title=f"Image {i}", url="http://a.com/a.jpg")
+            Action.objects.create(user=self.user, verb="liked", target=image)
+
+        Action.objects.create(user=self.user, verb="has created an account")
+
+        # Content types are cached per process after the first lookup
+        ContentType.objects.get_for_models(User, Image)
+
+    def test_one_query_per_content_type(self):
+        with self.assertNumQueries(3):
+            actions = hydrate_targets(Action.objects.all())
+
+        with self.assertNumQueries(0):
+            for action in actions:
+                if action.verb == "started following":
+                    action.target.profile
+                else:
+                    str(action.target)
+
+    def test_targets_match_generic_foreign_key(self):
+        actions = hydrate_targets(Action.objects.all())
+        for action in actions:
+            self.assertEqual(action.target, Action.objects.get(id=action.id).target)
+
+
+@mock.patch("actions.utils.push_action")
+class CreateActionTest(TransactionTestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user("user")
+        self.image = Image.objects.create(user=self.user, title="Image", url="http://a.com/a.jpg")
+
+    def test_repeated_action_is_ignored(self, push_action):
+        self.assertTrue(create_action(self.user, "liked", self.image))
+        self.assertFalse(create_action(self.user, "liked", self.image))
+        self.assertTrue(create_action(self.user, "bookmarked image", self.image))
+        self.assertEqual(Action.objects.count(), 2)
+
+    def test_concurrent_actions(self, push_action):
+        barrier = threading.Barrier(8)
+        results = []
+
+        def like():
+            barrier.wait()
+            try:
+                results.append(create_action(self.user, "liked", self.image))
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=like) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Every thread must have finished, not failed with another error
+        self.assertEqual(len(results), 8)
+        self.assertEqual(results.count(True), 1)
+        self.assertEqual(results.count(False), 7)
+        self.assertEqual(Action.objects.filter(verb="liked").count(), 1)
+
+
+class FeedTest(TestCase):
+    def setUp(self):
+        # actions.feed holds its own reference to common.redis.redis
+        patcher = mock.patch("actions.feed.redis", fakeredis.FakeRedis())
+        self.redis = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        User = get_user_model()
+        self.author = User.objects.create_user("author")
+        self.followers = [User.objects.create_user(f"follower{i}") for i in range(2)]
+        for follower in self.followers:
+            Contact.objects.create(user_from=follower, user_to=self.author)
+
+    def create_action(self, verb="has created an account"):
+        action = Action.objects.create(user=self.author, verb=verb)
+        feed.push_action(action)
+        return action
+
+    def test_push(self):
+        action = self.create_action()
+
+        for follower in self.followers:
+            self.assertEqual(feed.get_feed(follower), [action])
+
+    @override_settings(FEED_SIZE=2)
+    def test_push_trims_feed(self):
+        actions = [self.create_action(f"verb {i}") for i in range(3)]
+
+        self.assertEqual(self.redis.zcard(feed.feed_key(self.followers[0].id)), 2)
+        self.assertEqual(feed.get_feed(self.followers[0]), actions[:0:-1])
+
+    @override_settings(FEED_FANOUT_LIMIT=1)
+    def test_fanout_limit_merges_on_read(self):
+        action = self.create_action()
+
+        self.assertFalse(self.redis.exists(feed.feed_key(self.followers[0].id)))
+        self.assertTrue(self.redis.sismember(feed.FANOUT_SKIPPED_KEY, self.author.id))
+        for follower in self.followers:
+            self.assertEqual(feed.get_feed(follower), [action])
+
+    def test_follow_and_unfollow(self):
+        user = get_user_model().objects.create_user("user")
+        action = self.create_action()
+
+        Contact.objects.create(user_from=user, user_to=self.author)
+        feed.follow(user, self.author)
+        self.assertEqual(feed.get_feed(user), [action])
+
+        Contact.objects.filter(user_from=user, user_to=self.author).delete()
+        feed.unfollow(user, self.author)
+        self.assertEqual(feed.get_feed(user), [])
+
+    def test_unfollow_hides_older_actions(self):
+        follower = self.followers[0]
+        actions = [self.create_action(f"verb {i}") for i in range(2)]
+
+        Contact.objects.filter(user_from=follower, user_to=self.author).delete()
+        # Only the latest action is removed from the feed
+        with override_settings(FEED_SIZE=1):
+            feed.unfollow(follower, self.author)
+
+        self.assertEqual(
+            self.redis.zrange(feed.feed_key(follower.id), 0, -1),
+            [str(actions[0].id).encode()],
+        )
+        self.assertEqual(feed.get_feed(follower), [])
+
+    def test_redis_down(self):
+        broken = mock.Mock(side_effect=ConnectionError())
+        with mock.patch("actions.feed.redis") as redis:
+            redis.pipeline.return_value.execute = broken
+            redis.zrevrange = broken
+            action = self.create_action()
+
+            self.assertEqual(feed.get_feed(self.followers[0]), [action])
@@ -1,26 +1,39 @@
-import datetime
+import hashlib
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
+from .feed import push_action
 from .models import Action
 
 
-def create_action(user, verb, target=None):
-    now = timezone.now()
-    last_minute = now - datetime.timedelta(seconds=60)
-    similar_actions = Action.objects.filter(
-        user=user, verb=verb, created__gte=last_minute
-    )
-
+def get_dedupe_key(user, verb, target=None, now=None):
+    now = now or timezone.now()
+    minute = int(now.timestamp() // 60)
+    target_key = ""
     if target:
-        similar_actions = similar_actions.filter(
-            target_ct=ContentType.objects.get_for_model(target), target_id=target.id
-        )
+        target_ct = ContentType.objects.get_for_model(target)
+        target_key = f"{target_ct.id}:{target.id}"
+
+    key = f"{user.id}:{verb}:{target_key}:{minute}"
+    return hashlib.sha1(key.encode()).hexdigest()
 
-    if similar_actions:
+
+def create_action(user, verb, target=None):
+    """
+    Record an action, unless the same user did the same thing to the same
+    target in the current minute. The unique dedupe key makes this a single
+    insert, safe against concurrent requests.
+    """
+    action = Action(
+        user=user, verb=verb, target=target, dedupe_key=get_dedupe_key(user, verb, target)
+    )
+    try:
+        with transaction.atomic():
+            action.save()
+    except IntegrityError:
         return False
-    else:
-        action = Action(user=user, verb=verb, target=target)
-        action.save()
-        return True
+
+    push_action(action)
+    return True
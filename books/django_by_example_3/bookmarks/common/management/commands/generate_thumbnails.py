@@ -0,0 +1,55 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import connections
+from easy_thumbnails.alias import aliases
+from easy_thumbnails.exceptions import InvalidImageFormatError
+from easy_thumbnails.files import get_thumbnailer
+
+
+def generate(target, name):
+    thumbnailer = get_thumbnailer(default_storage, relative_name=name)
+    try:
+        for options in aliases.all(target=target).values():
+            thumbnailer.get_thumbnail(options)
+    except InvalidImageFormatError:
+        return False
+
+    return True
+
+
+class Command(BaseCommand):
+    help = "Generate the thumbnail aliases of every uploaded image"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--workers", dest="workers", type=int)
+
+    def handle(self, *args, **options):
+        targets = []
+        names = []
+        for target in settings.THUMBNAIL_ALIASES:
+            if not target:
+                continue
+            app_label, model_name, field_name = target.split(".")
+            model = apps.get_model(app_label, model_name)
+            files = model.objects.exclude(**{field_name: ""}).values_list(
+                field_name, flat=True
+            )
+            for name in files.iterator():
+                targets.append(target)
+                names.append(name)
+
+        # Each worker process opens its own database connection
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=options["workers"]) as executor:
+            results = list(executor.map(generate, targets, names, chunksize=20))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated thumbnails for {results.count(True)} images, "
+                f"{results.count(False)} failed"
+            )
+        )
@@ -0,0 +1,55 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+def encode_cursor(value, id):
+    return urlsafe_b64encode(f"{value.isoformat()}|{id}".encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        value, id = urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return parse_datetime(value), int(id)
+    except (AttributeError, ValueError, binascii.Error):
+        return None
+
+
+def keyset_filter(queryset, cursor, field="created"):
+    """
+    The queryset newest first by (field, id), after the cursor if any.
+
+    The redundant field <= value term lets the database seek an index on
+    (field, id) instead of scanning it from the newest row.
+    """
+    queryset = queryset.order_by(f"-{field}", "-id")
+
+    position = decode_cursor(cursor) if cursor else None
+    if position and position[0]:
+        value, id = position
+        queryset = queryset.filter(
+            Q(**{f"{field}__lte": value}),
+            Q(**{f"{field}__lt": value}) | Q(id__lt=id),
+        )
+
+    return queryset
+
+
+def keyset_page(queryset, cursor, per_page, field="created"):
+    """
+    A page of the queryset, newest first by (field, id), starting after the
+    cursor returned with the previous page. No COUNT or OFFSET is needed, so
+    every page costs the same.
+    """
+    queryset = keyset_filter(queryset, cursor, field)
+
+    items = list(queryset[: per_page + 1])
+    next_cursor = None
+    if len(items) > per_page:
+        items = items[:per_page]
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, field), last.id)
+
+    return items, next_cursor
@@ -0,0 +1,7 @@
+import redis as redislib
+from django.conf import settings
+
+pool = redislib.ConnectionPool(
+    host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB
+)
+redis = redislib.Redis(connection_pool=pool)
@@ -145,7 +145,31 @@ ABSOLUTE_URL_OVERRIDES = {
     "auth.user": lambda u: reverse_lazy("user_detail", args=[u.username])
 }
 
+# Thumbnails, generated when the image is uploaded
+THUMBNAIL_ALIASES = {
+    "images.Image.image": {
+        "detail": {"size": (300, 0)},
+        "list": {"size": (300, 300), "crop": "smart"},
+    },
+    "account.Profile.photo": {
+        "profile": {"size": (180, 180)},
+    },
+}
+THUMBNAIL_MANIFEST_SIZE = 10000
+
 # REDIS
 REDIS_HOST = "localhost"
 REDIS_PORT = 6379
-REDIS_DB = 0
\ No newline at end of file
+REDIS_DB = 0
+
+# Seconds image views are aggregated in the process before reaching Redis,
+# 0 sends every view right away
+IMAGE_VIEWS_FLUSH_INTERVAL = 0
+
+# Images downloaded by images.ingest
+IMAGE_DOWNLOAD_TIMEOUT = 10
+IMAGE_DOWNLOAD_MAX_SIZE = 10 * 1024 * 1024
+
+# Activity feed
+FEED_SIZE = 200
+FEED_FANOUT_LIMIT = 1000
@@ -0,0 +1,122 @@
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from redis.exceptions import RedisError
+
+from common.redis import redis
+
+from .models import Image
+
+logger = logging.getLogger(__name__)
+
+RANKING_KEY = "image_ranking"
+
+
+def views_key(image_id):
+    return f"image:{image_id}:views"
+
+
+def count_view(image_id):
+    """
+    Count a view of an image, returning its total views.
+
+    Both the counter and the ranking are updated in a single round trip.
+    """
+    if settings.IMAGE_VIEWS_FLUSH_INTERVAL:
+        return buffer.add(image_id)
+
+    pipe = redis.pipeline(transaction=False)
+    pipe.incr(views_key(image_id))
+    pipe.zincrby(name=RANKING_KEY, amount=1, value=image_id)
+    total_views, _ = pipe.execute()
+    return total_views
+
+
+def get_most_viewed(count):
+    """
+    Most viewed images, in ranking order, read from the Redis sorted set.
+    """
+    ranking = [int(id) for id in redis.zrange(RANKING_KEY, 0, count - 1, desc=True)]
+    images = Image.objects.in_bulk(ranking)
+    return [images[id] for id in ranking if id in images]
+
+
+class ViewsBuffer:
+    """
+    Aggregates views in the process and sends them to Redis from a
+    background thread every IMAGE_VIEWS_FLUSH_INTERVAL seconds, and when
+    the process exits, for very popular images.
+
+    Totals are only kept for the images viewed since the previous flush.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Only one flush at a time, so views are never sent twice
+        self.flush_lock = threading.Lock()
+        self.pending = {}
+        self.totals = {}
+        self.thread = None
+
+    def add(self, image_id):
+        with self.lock:
+            if self.thread is None:
+                self.start()
+            self.pending[image_id] = self.pending.get(image_id, 0) + 1
+            pending = self.pending[image_id]
+            total_views = self.totals.get(image_id)
+
+        if total_views is None:
+            total_views = int(redis.get(views_key(image_id)) or 0)
+            with self.lock:
+                total_views = self.totals.setdefault(image_id, total_views)
+
+        return total_views + pending
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        atexit.register(self.run_flush)
+
+    def run(self):
+        while True:
+            time.sleep(settings.IMAGE_VIEWS_FLUSH_INTERVAL)
+            self.run_flush()
+
+    def run_flush(self):
+        try:
+            self.flush()
+        except RedisError:
+            logger.exception("Could not send image views to Redis")
+
+    def flush(self):
+        """
+        Send the pending views. They are only taken out of pending once Redis
+        has them, so a failed flush keeps them for the next one.
+        """
+        with self.flush_lock:
+            with self.lock:
+                pending = dict(self.pending)
+            if not pending:
+                return
+
+            pipe = redis.pipeline(transaction=False)
+            for image_id, views in pending.items():
+                pipe.incrby(views_key(image_id), views)
+                pipe.zincrby(name=RANKING_KEY, amount=views, value=image_id)
+            results = pipe.execute()
+
+            with self.lock:
+                for image_id, views in pending.items():
+                    left = self.pending[image_id] - views
+                    if left:
+                        self.pending[image_id] = left
+                    else:
+                        del self.pending[image_id]
+                self.totals = dict(zip(pending, results[::2]))
+
+
+buffer = ViewsBuffer()
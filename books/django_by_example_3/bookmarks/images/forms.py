@@ -1,8 +1,4 @@
-from urllib import request
-
 from django import forms
-from django.core.files.base import ContentFile
-from django.utils.text import slugify
 
 from .models import Image
 
@@ -21,20 +17,3 @@ class ImageCreateForm(forms.ModelForm):
             raise forms.ValidationError("We only accept jpg or jpegs")
 
         return url
-
-    def save(self, force_insert=False, force_update=False, commit=True):
-        image = super().save(commit=False)
-
-        image_url = self.cleaned_data["url"]
-        extension = image_url.split(".")[-1].lower()
-
-        name = slugify(image.title)
-        image_name = f"{name}.{extension}"
-
-        response = request.urlopen(image_url)
-        image.image.save(image_name, ContentFile(response.read()), save=False)
-
-        if commit:
-            image.save()
-
-        return image
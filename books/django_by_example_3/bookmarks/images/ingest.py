@@ -0,0 +1,80 @@
+import logging
+import tempfile
+from urllib import request
+
+from django.conf import settings
+from django.core.files import File
+from django.utils.text import slugify
+from easy_thumbnails.files import generate_all_aliases
+
+from .models import Image
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ImageTooLarge(Exception):
+    pass
+
+
+def download(url, file):
+    """
+    Stream url into file, giving up past IMAGE_DOWNLOAD_MAX_SIZE bytes.
+    """
+    size = 0
+    with request.urlopen(url, timeout=settings.IMAGE_DOWNLOAD_TIMEOUT) as response:
+        while True:
+            chunk = response.read(CHUNK_SIZE)
+            if not chunk:
+                break
+
+            size += len(chunk)
+            if size > settings.IMAGE_DOWNLOAD_MAX_SIZE:
+                raise ImageTooLarge(url)
+            file.write(chunk)
+
+
+def ingest_image(image):
+    """
+    Download the file of a pending image and prepare its thumbnails.
+    """
+    extension = image.url.split(".")[-1].lower()
+    name = f"{slugify(image.title)}.{extension}"
+
+    try:
+        with tempfile.TemporaryFile() as file:
+            download(image.url, file)
+            file.seek(0)
+            image.image.save(name, File(file), save=False)
+        # Saving the file already generates them, but swallows errors
+        generate_all_aliases(image.image, include_global=True)
+    except Exception:
+        # Any bad URL or file fails only this image, so the next ones in the
+        # queue are still ingested
+        logger.exception("Could not ingest image %s from %s", image.id, image.url)
+        image.status = "failed"
+    else:
+        image.status = "ready"
+
+    image.save(update_fields=["image", "status"])
+
+
+def ingest_pending_images(batch_size=10):
+    """
+    Ingest the oldest pending images. Each one is claimed with a conditional
+    update first, so concurrent workers never download the same image.
+    """
+    ids = Image.objects.filter(status="pending").order_by("created")
+    ids = list(ids.values_list("id", flat=True)[:batch_size])
+
+    total = 0
+    for id in ids:
+        claimed = Image.objects.filter(id=id, status="pending").update(
+            status="downloading"
+        )
+        if claimed:
+            ingest_image(Image.objects.get(id=id))
+            total += 1
+
+    return total
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from images.ingest import ingest_pending_images
+
+
+class Command(BaseCommand):
+    help = "Download the files of the images bookmarked by users"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--batch-size", dest="batch_size", type=int, default=10)
+        parser.add_argument(
+            "--interval",
+            dest="interval",
+            type=int,
+            help="Keep running, polling for pending images every given seconds",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            total = ingest_pending_images(options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"Processed {total} images"))
+
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
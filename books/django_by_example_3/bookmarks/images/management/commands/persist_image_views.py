@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from common.redis import redis
+from images.counters import RANKING_KEY
+from images.models import Image
+
+
+class Command(BaseCommand):
+    help = "Copy the image view totals from Redis into the database"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--batch-size", dest="batch_size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total = 0
+        views = {}
+
+        # ZSCAN returns every image even while scores change, where pages by
+        # rank would shift and skip or repeat images
+        for image_id, score in redis.zscan_iter(RANKING_KEY, count=batch_size):
+            views[int(image_id)] = int(score)
+            if len(views) >= batch_size:
+                total += self.persist(views)
+                views = {}
+        total += self.persist(views)
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {total} images"))
+
+    def persist(self, views):
+        images = Image.objects.only("id", "total_views").in_bulk(views)
+        for image in images.values():
+            image.total_views = views[image.id]
+        Image.objects.bulk_update(images.values(), ["total_views"])
+        return len(images)
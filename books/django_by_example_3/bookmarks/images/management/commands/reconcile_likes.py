@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from images.models import Image
+
+
+class Command(BaseCommand):
+    help = "Recompute the likes counter of every image"
+
+    def handle(self, *args, **options):
+        Like = Image.users_likes.through
+        likes = (
+            Like.objects.filter(image_id=OuterRef("pk"))
+            .values("image_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        total = Image.objects.update(total_likes=Coalesce(Subquery(likes), 0))
+        self.stdout.write(self.style.SUCCESS(f"Updated {total} images"))
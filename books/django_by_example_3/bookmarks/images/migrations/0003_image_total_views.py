@@ -0,0 +1,18 @@
+# Generated by Django 3.0.8 on 2026-10-18 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0002_image_total_likes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='image',
+            name='total_views',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.0.8 on 2026-10-18 15:50
+
+from django.db import migrations, models
+
+
+def mark_existing_ready(apps, schema_editor):
+    Image = apps.get_model('images', 'Image')
+    Image.objects.update(status='ready')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0003_image_total_views'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='image',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('ready', 'Ready'), ('failed', 'Failed')], db_index=True, default='pending', max_length=10),
+        ),
+        migrations.RunPython(mark_existing_ready, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.0.8 on 2026-10-18 16:10
+
+from django.db import migrations
+import easy_thumbnails.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0004_image_status'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='image',
+            name='image',
+            field=easy_thumbnails.fields.ThumbnailerImageField(upload_to='images/%Y/%m/%d/'),
+        ),
+    ]
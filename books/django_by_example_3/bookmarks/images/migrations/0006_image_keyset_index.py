@@ -0,0 +1,17 @@
+# Generated by Django 3.0.8 on 2026-10-18 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0005_image_thumbnailer_field'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='image',
+            index=models.Index(fields=['created', 'id'], name='images_image_keyset'),
+        ),
+    ]
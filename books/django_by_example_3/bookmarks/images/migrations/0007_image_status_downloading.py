@@ -0,0 +1,18 @@
+# Generated by Django 3.0.8 on 2026-10-18 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0006_image_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='image',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('downloading', 'Downloading'), ('ready', 'Ready'), ('failed', 'Failed')], db_index=True, default='pending', max_length=11),
+        ),
+    ]
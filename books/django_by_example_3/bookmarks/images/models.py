@@ -1,18 +1,26 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from easy_thumbnails.fields import ThumbnailerImageField
 from django.urls import reverse
 from django.utils.text import slugify
 
 
 # Create your models here.
 class Image(models.Model):
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("downloading", "Downloading"),
+        ("ready", "Ready"),
+        ("failed", "Failed"),
+    )
+
     user = models.ForeignKey(
         get_user_model(), related_name="images_created", on_delete=models.CASCADE
     )
     title = models.CharField(max_length=200)
     slug = models.SlugField(max_length=200, blank=True)
     url = models.URLField()
-    image = models.ImageField(upload_to="images/%Y/%m/%d/")
+    image = ThumbnailerImageField(upload_to="images/%Y/%m/%d/")
     description = models.TextField(blank=True)
     created = models.DateTimeField(auto_now_add=True, db_index=True)
 
@@ -20,6 +28,14 @@ class Image(models.Model):
         get_user_model(), related_name="images_liked", blank=True
     )
     total_likes = models.PositiveIntegerField(db_index=True, default=0)
+    total_views = models.PositiveIntegerField(db_index=True, default=0)
+    # The file is downloaded from url in the background, see images.ingest
+    status = models.CharField(
+        max_length=11, choices=STATUS_CHOICES, default="pending", db_index=True
+    )
+
+    class Meta:
+        indexes = (models.Index(fields=["created", "id"], name="images_image_keyset"),)
 
     def __str__(self):
         return self.title
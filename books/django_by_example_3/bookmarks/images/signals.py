@@ -1,9 +1,47 @@
+from django.db.models import F
 from django.db.models.signals import m2m_changed
 from django.dispatch import receiver
 
 from .models import Image
 
+
 @receiver(m2m_changed, sender=Image.users_likes.through)
-def users_likes_changed(sender, instance, **kwargs):
-    instance.total_likes = instance.users_likes.count()
-    instance.save()
\ No newline at end of file
+def users_likes_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_remove":
+        # pk_set has every id asked to be removed, not only the liked ones
+        if reverse:
+            liked = sender.objects.filter(user_id=instance.pk, image_id__in=pk_set)
+            instance._unliked = set(liked.values_list("image_id", flat=True))
+        else:
+            liked = sender.objects.filter(image_id=instance.pk, user_id__in=pk_set)
+            instance._unliked = set(liked.values_list("user_id", flat=True))
+        return
+
+    if action == "pre_clear":
+        if reverse:
+            liked = sender.objects.filter(user_id=instance.pk)
+            instance._unliked = set(liked.values_list("image_id", flat=True))
+        return
+
+    if action == "post_clear" and not reverse:
+        Image.objects.filter(pk=instance.pk).update(total_likes=0)
+        instance.total_likes = 0
+        return
+
+    if action == "post_add":
+        changed, amount = pk_set, 1
+    elif action in ("post_remove", "post_clear"):
+        changed, amount = instance._unliked, -1
+    else:
+        return
+
+    if not changed:
+        return
+
+    if reverse:
+        Image.objects.filter(pk__in=changed).update(total_likes=F("total_likes") + amount)
+    else:
+        Image.objects.filter(pk=instance.pk).update(
+            total_likes=F("total_likes") + amount * len(changed)
+        )
+        instance.refresh_from_db(fields=["total_likes"])
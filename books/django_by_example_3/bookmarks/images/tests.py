@@ -1,3 +1,229 @@
-from django.test import TestCase
+import shutil
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import BytesIO, StringIO
+from unittest import mock
+
+import fakeredis
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image as PILImage
+from redis.exceptions import ConnectionError
+
+from .counters import RANKING_KEY, ViewsBuffer, views_key
+
+from .ingest import ingest_image, ingest_pending_images
+from .models import Image
+
+
+def make_jpeg():
+    content = BytesIO()
+    PILImage.new("RGB", (400, 400), "red").save(content, "JPEG")
+    return content.getvalue()
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    content = make_jpeg()
+
+    def do_GET(self):
+        if self.path == "/missing.jpg":
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.end_headers()
+        self.wfile.write(self.content)
+
+    def log_message(self, *args):
+        pass
+
 
 # Create your tests here.
+class IngestImageTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = HTTPServer(("127.0.0.1", 0), ImageHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+        cls.media_root = tempfile.mkdtemp()
+        cls.media_settings = override_settings(MEDIA_ROOT=cls.media_root)
+        cls.media_settings.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.media_settings.disable()
+        shutil.rmtree(cls.media_root)
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def create_image(self, path, url=None):
+        user, _ = get_user_model().objects.get_or_create(username="user")
+        return Image.objects.create(
+            user=user, title="Red", url=url or f"{self.base_url}{path}"
+        )
+
+    def test_image_is_downloaded(self):
+        image = self.create_image("/red.jpg")
+        self.assertEqual(image.status, "pending")
+
+        ingest_image(image)
+
+        image.refresh_from_db()
+        self.assertEqual(image.status, "ready")
+        self.assertEqual(image.image.read(), ImageHandler.content)
+
+    @override_settings(IMAGE_DOWNLOAD_MAX_SIZE=1024)
+    def test_image_too_large(self):
+        image = self.create_image("/red.jpg")
+        ingest_image(image)
+        self.assertEqual(Image.objects.get(id=image.id).status, "failed")
+
+    def test_image_not_found(self):
+        image = self.create_image("/missing.jpg")
+        ingest_image(image)
+        self.assertEqual(Image.objects.get(id=image.id).status, "failed")
+
+    def test_concurrent_workers(self):
+        self.create_image("/red.jpg")
+        self.create_image("/red.jpg")
+        ingested = []
+        inner_totals = []
+
+        def ingest(image):
+            ingested.append(image.id)
+            if len(ingested) == 1:
+                # Another worker runs while the first image is downloaded
+                inner_totals.append(ingest_pending_images())
+
+        with mock.patch("images.ingest.ingest_image", side_effect=ingest):
+            self.assertEqual(ingest_pending_images(), 1)
+
+        self.assertEqual(inner_totals, [1])
+        self.assertEqual(len(set(ingested)), 2)
+        self.assertEqual(len(ingested), 2)
+
+    def test_bad_url_doesnt_stop_the_queue(self):
+        bad = self.create_image(None, url="not a url")
+        good = self.create_image("/red.jpg")
+
+        self.assertEqual(ingest_pending_images(), 2)
+        self.assertEqual(Image.objects.get(id=bad.id).status, "failed")
+        self.assertEqual(Image.objects.get(id=good.id).status, "ready")
+
+
+class TotalLikesTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.users = [User.objects.create_user(f"user{i}") for i in range(3)]
+        self.image = Image.objects.create(
+            user=self.users[0], title="Image", url="http://a.com/a.jpg"
+        )
+        self.other = Image.objects.create(
+            user=self.users[0], title="Other", url="http://a.com/b.jpg"
+        )
+
+    def total_likes(self, image):
+        return Image.objects.get(id=image.id).total_likes
+
+    def test_add_and_remove(self):
+        self.image.users_likes.add(*self.users)
+        self.assertEqual(self.image.total_likes, 3)
+
+        # Removing a user who never liked it changes nothing
+        self.image.users_likes.remove(self.users[0])
+        self.image.users_likes.remove(self.users[0])
+        self.assertEqual(self.image.total_likes, 2)
+        self.assertEqual(self.total_likes(self.image), 2)
+
+    def test_clear(self):
+        self.image.users_likes.add(*self.users)
+        self.image.users_likes.clear()
+
+        self.assertEqual(self.image.total_likes, 0)
+        self.assertEqual(self.total_likes(self.image), 0)
+
+    def test_reverse(self):
+        user = self.users[0]
+        user.images_liked.add(self.image, self.other)
+        user.images_liked.remove(self.other)
+        self.assertEqual(self.total_likes(self.image), 1)
+        self.assertEqual(self.total_likes(self.other), 0)
+
+        self.users[1].images_liked.add(self.image)
+        user.images_liked.clear()
+        self.assertEqual(self.total_likes(self.image), 1)
+
+    def test_reconcile_likes(self):
+        self.image.users_likes.add(*self.users)
+        Image.objects.update(total_likes=10)
+
+        call_command("reconcile_likes", stdout=StringIO())
+
+        self.assertEqual(self.total_likes(self.image), 3)
+        self.assertEqual(self.total_likes(self.other), 0)
+
+
+@mock.patch.object(ViewsBuffer, "start")
+class ViewsBufferTest(TestCase):
+    def setUp(self):
+        patcher = mock.patch("images.counters.redis", fakeredis.FakeRedis())
+        self.redis = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.buffer = ViewsBuffer()
+
+    def test_add(self, start):
+        self.redis.set(views_key(1), 5)
+
+        self.assertEqual(self.buffer.add(1), 6)
+        self.assertEqual(self.buffer.add(1), 7)
+        self.assertEqual(self.buffer.add(2), 1)
+        # Nothing reaches Redis before the flush
+        self.assertEqual(self.redis.get(views_key(1)), b"5")
+
+    def test_flush(self, start):
+        self.buffer.add(1)
+        self.buffer.add(1)
+        self.buffer.add(2)
+        self.buffer.flush()
+
+        self.assertEqual(self.redis.get(views_key(1)), b"2")
+        self.assertEqual(self.redis.zscore(RANKING_KEY, 2), 1)
+        self.assertEqual(self.buffer.pending, {})
+        self.assertEqual(self.buffer.add(1), 3)
+
+    def test_failed_flush_keeps_views(self, start):
+        self.buffer.add(1)
+        with mock.patch.object(
+            fakeredis.FakeRedis, "pipeline", side_effect=ConnectionError()
+        ):
+            self.buffer.run_flush()
+
+        self.assertEqual(self.buffer.pending, {1: 1})
+        self.buffer.flush()
+        self.assertEqual(self.redis.get(views_key(1)), b"1")
+
+
+class PersistImageViewsTest(TestCase):
+    def test_persist(self):
+        user = get_user_model().objects.create_user("user")
+        images = [
+            Image.objects.create(user=user, title=f"Image {i}", url="http://a.com/a.jpg")
+            for i in range(3)
+        ]
+        redis = fakeredis.FakeRedis()
+        redis.zadd(RANKING_KEY, {image.id: i + 1 for i, image in enumerate(images)})
+
+        with mock.patch(
+            "images.management.commands.persist_image_views.redis", redis
+        ):
+            call_command("persist_image_views", batch_size=2, stdout=StringIO())
+
+        self.assertEqual(
+            [Image.objects.get(id=image.id).total_views for image in images], [1, 2, 3]
+        )
@@ -1,21 +1,18 @@
-import redis as redislib
-from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.http import HttpResponse, JsonResponse
+from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.http import require_POST
 
 from actions.utils import create_action
 from common.decorators import require_AJAX
+from common.pagination import keyset_page
 
+from .counters import count_view, get_most_viewed
 from .forms import ImageCreateForm
 from .models import Image
 
 
-redis = redislib.Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB)
-
 # Create your views here.
 @login_required
 def image_create(request):
@@ -26,7 +23,9 @@ def image_create(request):
         new_item = form.save(commit=False)
         new_item.user = request.user
         new_item.save()
-        messages.success(request, "Image created successfully")
+        messages.success(
+            request, "Image bookmarked, it will show up once it's downloaded"
+        )
 
         create_action(request.user, "bookmarked image", new_item)
 
@@ -40,9 +39,7 @@ def image_create(request):
 def image_detail(request, id, slug):
     image = get_object_or_404(Image, id=id, slug=slug)
 
-    total_views = redis.incr(f"image:{image.id}:views")
-    # score
-    redis.zincrby(name="image_ranking", value=image.id, amount=1)
+    total_views = count_view(image.id)
 
     return render(
         request, "images/image/detail.html", {"section": "images", "image": image, "total_views": total_views}
@@ -56,19 +53,16 @@ def image_like(request):
     image_id = request.POST.get("id")
     image = get_object_or_404(Image, id=image_id)
 
-    total_likes = image.users_likes.count()
-
     action = request.POST.get("action")
     try:
+        # The m2m_changed signal updates image.total_likes
         if action == "like":
             image.users_likes.add(request.user)
-            total_likes += 1
             create_action(request.user, "liked", image)
         else:
             image.users_likes.remove(request.user)
-            total_likes -= 1
 
-        return JsonResponse({"status": "ok", "total_likes": total_likes})
+        return JsonResponse({"status": "ok", "total_likes": image.total_likes})
 
     except:
         return JsonResponse({"status": "error"})
@@ -76,25 +70,33 @@ def image_like(request):
 
 @login_required
 def image_list(request):
-    images = Image.objects.all()
-    paginator = Paginator(images, 2)
-
-    page = request.GET.get("page", 1)
-    try:
-        images = paginator.page(page)
-    except EmptyPage:
-        if request.is_ajax():
-            return HttpResponse("")
-        else:
-            images = paginator.page(images, paginator.num_pages)
+    images = Image.objects.filter(status="ready")
+    images, next_cursor = keyset_page(images, request.GET.get("cursor"), 2)
 
     if request.is_ajax():
-        return render(
+        response = render(
             request,
             "images/image/list_ajax.html",
             {"images": images, "section": "images"},
         )
+        response["X-Next-Cursor"] = next_cursor or ""
+        return response
     else:
         return render(
-            request, "images/image/list.html", {"images": images, "section": "images"}
+            request,
+            "images/image/list.html",
+            {"images": images, "next_cursor": next_cursor, "section": "images"},
         )
+
+
+@login_required
+def image_ranking(request):
+    # Called by the template only when the cached fragment has expired
+    def most_viewed():
+        return get_most_viewed(10)
+
+    return render(
+        request,
+        "images/image/ranking.html",
+        {"section": "images", "most_viewed": most_viewed},
+    )
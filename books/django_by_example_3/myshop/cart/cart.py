@@ -9,35 +9,60 @@ class Cart:
     def __init__(self, request):
         """
         Init the cart.
+
+        The session only holds product ids, quantities and prices as strings.
         """
         self.session = request.session
-        self.cart = self.session.get(settings.CART_SESSION_ID)
-        if not self.cart:
-            self.cart = self.session[settings.CART_SESSION_ID] = {}
+        # Only stored in the session on the first change, so showing an empty
+        # cart doesn't save the session
+        self.cart = self.session.get(settings.CART_SESSION_ID, {})
+        self._items = None
+        self._length = None
+
+    def _load(self):
+        """
+        Cart items with their products, fetched once and kept until the cart
+        changes.
+        """
+        if self._items is None:
+            products = Product.objects.in_bulk(self.cart.keys())
+
+            self._items = []
+            for product_id, item in list(self.cart.items()):
+                product = products.get(int(product_id))
+                if product is None:
+                    # Removed from the catalog since it was added
+                    del self.cart[product_id]
+                    self.session.modified = True
+                    self._length = None
+                    continue
+
+                price = Decimal(item["price"])
+                self._items.append(
+                    {
+                        "product": product,
+                        "quantity": item["quantity"],
+                        "price": price,
+                        "total_price": price * item["quantity"],
+                    }
+                )
+
+        return self._items
 
     def __iter__(self):
         """
         Iterate over cart items.
         """
-        products_ids = self.cart.keys()
-        products = Product.objects.filter(id__in=products_ids)
-
-        cart = self.cart.copy()
-
-        for product in products:
-            cart_item = cart[str(product.id)]
-            cart_item["product"] = product
-
-        for item in cart.values():
-            item["price"] = Decimal(item["price"])
-            item["total_price"] = item["price"] * item["quantity"]
-            yield item
+        return iter(self._load())
 
     def __len__(self):
         """
         Cart's total number of items.
         """
-        return sum(item["quantity"] for item in self.cart.values())
+        if self._length is None:
+            self._length = sum(item["quantity"] for item in self.cart.values())
+
+        return self._length
 
     def add(self, product, quantity=1, override_quantity=False):
         """
@@ -63,18 +88,17 @@ class Cart:
             self.save()
 
     def save(self):
+        self.session[settings.CART_SESSION_ID] = self.cart
         self.session.modified = True
+        self._items = None
+        self._length = None
 
     def get_total_price(self):
         """
-        Cart items total price.
+        Cart items total price, summed from the loaded items.
         """
-        total_price = Decimal("0.0")
-        for item in self:
-            total_price += Decimal(item["total_price"])
-
-        return total_price
+        return sum((item["total_price"] for item in self._load()), Decimal("0.0"))
 
     def clear(self):
-        self.session[settings.CART_SESSION_ID] = {}
-        self.save()
\ No newline at end of file
+        self.cart = {}
+        self.save()
@@ -1,4 +1,8 @@
+from django.utils.functional import SimpleLazyObject
+
 from .cart import Cart
 
+
 def cart(request):
-    return {"cart": Cart(request)}
\ No newline at end of file
+    # The session is only read by templates that use the cart
+    return {"cart": SimpleLazyObject(lambda: Cart(request))}
@@ -0,0 +1,70 @@
+import copy
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client, override_settings
+
+from cart.cart import Cart
+from shop.models import Category, Product
+
+LAZY_PROCESSOR = "cart.context_processors.cart"
+EAGER_PROCESSOR = "cart.management.commands.benchmark_product_page.eager_cart"
+
+
+def eager_cart(request):
+    """
+    The context processor as it was: the cart is built for every template
+    and an empty one is written to the session, which is then saved
+    """
+    cart = Cart(request)
+    request.session[settings.CART_SESSION_ID] = cart.cart
+    return {"cart": cart}
+
+
+def templates_with(processor):
+    templates = copy.deepcopy(settings.TEMPLATES)
+    for template in templates:
+        processors = template.get("OPTIONS", {}).get("context_processors", [])
+        template["OPTIONS"]["context_processors"] = [
+            processor if name == LAZY_PROCESSOR else name for name in processors
+        ]
+    return templates
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure anonymous product page throughput with the lazy and the eager "
+        "cart context processor. The product is rolled back afterwards"
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--requests", dest="requests", type=int, default=500)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            category = Category.objects.create(name="Benchmark", slug="benchmark")
+            product = Product.objects.create(
+                category=category, name="Benchmark", slug="benchmark", price=Decimal(1)
+            )
+            url = product.get_absolute_url()
+
+            processors = (("lazy", LAZY_PROCESSOR), ("eager", EAGER_PROCESSOR))
+            for name, processor in processors:
+                with override_settings(TEMPLATES=templates_with(processor)):
+                    per_second = self.measure(url, options["requests"])
+                self.stdout.write(f"{name} cart: {per_second:.0f} requests/s")
+
+            transaction.set_rollback(True)
+
+    def measure(self, url, requests):
+        # A new client for every request, as visitors without a session
+        start = time.perf_counter()
+        for _ in range(requests):
+            response = Client(HTTP_HOST="localhost").get(url)
+            if response.status_code != 200:
+                raise CommandError(f"{url} answered {response.status_code}")
+
+        return requests / (time.perf_counter() - start)
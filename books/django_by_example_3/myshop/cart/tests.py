@@ -1,3 +1,76 @@
-from django.test import TestCase
+from decimal import Decimal
+
+from django.contrib.sessions.backends.signed_cookies import SessionStore
+from django.test import RequestFactory, TestCase
+
+from shop.models import Category, Product
+
+from .cart import Cart
+from .context_processors import cart as cart_context_processor
+
 
 # Create your tests here.
+class CartTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name="Tea", slug="tea")
+        cls.green = Product.objects.create(
+            category=category, name="Green", slug="green", price=Decimal("10.00")
+        )
+        cls.black = Product.objects.create(
+            category=category, name="Black", slug="black", price=Decimal("2.50")
+        )
+
+    def setUp(self):
+        self.request = RequestFactory().get("/")
+        self.request.session = SessionStore()
+
+    def test_single_query(self):
+        cart = Cart(self.request)
+        cart.add(self.green, 2)
+        cart.add(self.black)
+
+        with self.assertNumQueries(1):
+            items = list(cart)
+            list(cart)
+            total_price = cart.get_total_price()
+
+        self.assertEqual([item["product"] for item in items], [self.green, self.black])
+        self.assertEqual(items[0]["total_price"], Decimal("20.00"))
+        self.assertEqual(total_price, Decimal("22.50"))
+
+    def test_session_keeps_primitives(self):
+        cart = Cart(self.request)
+        cart.add(self.green)
+        list(cart)
+
+        self.assertEqual(
+            self.request.session["cart"],
+            {str(self.green.id): {"quantity": 1, "price": "10.00"}},
+        )
+
+    def test_removed_product(self):
+        removed = Product.objects.create(
+            category=self.green.category, name="White", slug="white", price=1
+        )
+        cart = Cart(self.request)
+        cart.add(self.green)
+        cart.add(removed)
+        removed.delete()
+
+        self.assertEqual(cart.get_total_price(), Decimal("10.00"))
+        self.assertEqual([item["product"] for item in cart], [self.green])
+        self.assertEqual(len(cart), 1)
+
+    def test_empty_cart_doesnt_change_session(self):
+        cart = Cart(self.request)
+
+        self.assertEqual(len(cart), 0)
+        self.assertFalse(self.request.session.modified)
+
+    def test_lazy_context_processor(self):
+        context = cart_context_processor(self.request)
+        self.assertFalse(self.request.session.accessed)
+
+        self.assertEqual(len(context["cart"]), 0)
+        self.assertTrue(self.request.session.accessed)
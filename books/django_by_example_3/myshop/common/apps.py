@@ -3,3 +3,10 @@ from django.apps import AppConfig
 
 class CommonConfig(AppConfig):
     name = 'common'
+
+    def ready(self) -> None:
+        from easy_thumbnails.signal_handlers import generate_aliases
+        from easy_thumbnails.signals import saved_file
+
+        # Thumbnails are generated on upload instead of on first render
+        saved_file.connect(generate_aliases)
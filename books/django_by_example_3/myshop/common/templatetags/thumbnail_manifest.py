@@ -0,0 +1,10 @@
+from django import template
+
+from ..thumbnails import thumbnail_url
+
+register = template.Library()
+
+
+@register.filter
+def thumbnail_alias(file, alias):
+    return thumbnail_url(file, alias)
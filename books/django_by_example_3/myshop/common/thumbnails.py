@@ -0,0 +1,28 @@
+from django.conf import settings
+from easy_thumbnails.exceptions import InvalidImageFormatError
+from easy_thumbnails.files import get_thumbnailer
+
+# URL of every thumbnail already known by this process, keyed by source file
+# name and alias, so rendering doesn't check the storage for them
+manifest = {}
+
+
+def thumbnail_url(file, alias):
+    if not file:
+        return ""
+
+    key = (file.name, alias)
+    url = manifest.get(key)
+    if url is None:
+        try:
+            url = get_thumbnailer(file)[alias].url
+        except (InvalidImageFormatError, OSError):
+            # Missing or broken source, as the thumbnail tag renders it.
+            # Not kept, so it's tried again once the file is fixed
+            return ""
+
+        if len(manifest) >= settings.THUMBNAIL_MANIFEST_SIZE:
+            manifest.clear()
+        manifest[key] = url
+
+    return url
@@ -137,6 +137,14 @@ MEDIA_URL = "/media/"
 # Extra
 CART_SESSION_ID = 'cart'
 
+# Thumbnails, generated when the image is uploaded
+THUMBNAIL_ALIASES = {
+    "shop.Product.image": {
+        "product": {"size": (60, 60), "crop": "smart", "autocrop": True},
+    },
+}
+THUMBNAIL_MANIFEST_SIZE = 10000
+
 USE_THOUSAND_SEPARATOR = True
 
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
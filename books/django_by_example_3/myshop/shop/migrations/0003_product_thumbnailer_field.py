@@ -0,0 +1,19 @@
+# Generated by Django 3.0.8 on 2026-10-18 16:20
+
+from django.db import migrations
+import easy_thumbnails.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0002_auto_20200714_0449'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='image',
+            field=easy_thumbnails.fields.ThumbnailerImageField(blank=True, upload_to='products/%Y/%m/%d/'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from easy_thumbnails.fields import ThumbnailerImageField
 from django.urls import reverse
 
 # Create your models here.
@@ -24,7 +25,7 @@ class Product(models.Model):
     )
     name = models.CharField(max_length=200, db_index=True)
     slug = models.CharField(max_length=200, db_index=True, unique=True)
-    image = models.ImageField(upload_to="products/%Y/%m/%d/", blank=True)
+    image = ThumbnailerImageField(upload_to="products/%Y/%m/%d/", blank=True)
     description = models.TextField(blank=True)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     available = models.BooleanField(default=True)